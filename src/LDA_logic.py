@@ -1,27 +1,385 @@
-import random
-from typing import List, Tuple, Union
+import functools
+import gc
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import tempfile
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Tuple, Union
 
-import en_core_web_lg
 import matplotlib.pyplot as plt
 import nltk
+import numpy as np
 import pyLDAvis.gensim_models
 import seaborn as sns
+import spacy
+from gensim.corpora import MmCorpus
 from gensim.corpora.dictionary import Dictionary as MappingDictionary
-from gensim.models import CoherenceModel, LdaMulticore
+from gensim.matutils import corpus2csc
+from gensim.models import CoherenceModel
+from gensim.models.coherencemodel import SLIDING_WINDOW_BASED
 from gensim.models.ldamodel import LdaModel
+from joblib import delayed, Parallel, parallel_config
 from loguru import logger
 from nltk.corpus import stopwords
-from numpy.random import RandomState
+from pyLDAvis import PreparedData
 from PyQt5.QtCore import pyqtSignal, QMutex, QObject
-from PyQt5.QtWidgets import QMessageBox
+from spacy.attrs import IS_ALPHA, IS_STOP, LEMMA, POS
+from spacy.lang.lex_attrs import is_stop
 from spacy.language import Language
+from spacy.parts_of_speech import IDS as POS_IDS
 from spacy.tokens import Doc
+from threadpoolctl import threadpool_limits
 
 from wrangler import DataWrangler
 
 nltk.download("stopwords")
 sns.set_theme()
 
+SPACY_BATCH_SIZE: int = int(os.environ.get("LDA_SPACY_BATCH", 64))
+# Any installed English pipeline with a tagger, attribute_ruler and lemmatizer
+# works; en_core_web_sm lemmatizes several times faster than _lg for a small
+# loss in tagging accuracy.
+SPACY_MODEL: str = os.environ.get("LDA_SPACY_MODEL", "en_core_web_lg")
+SPACY_PROCESSES: int = max(1, (os.cpu_count() or 2) - 1)
+# Documents per slice of the spill file handed to one doc2bow task.
+BOW_CHUNK_DOCS: int = 5000
+# Preprocessed corpora are kept here, one directory per distinct input, so an
+# unchanged corpus is not lemmatized again on the next run.
+PREPROCESS_CACHE_DIR: str = os.environ.get(
+    "LDA_CACHE_DIR", os.path.join(tempfile.gettempdir(), "ml-data-wrangler")
+)
+# Preprocessed corpora kept in PREPROCESS_CACHE_DIR; the least recently used
+# directories beyond this are deleted after each run.
+PREPROCESS_CACHE_ENTRIES: int = int(os.environ.get("LDA_CACHE_ENTRIES", 3))
+# Topic counts in the coherence sweep are trained side by side as single-threaded
+# LdaModels, one per process, leaving a core free for the GUI thread.
+SWEEP_PROCESSES: int = max(1, (os.cpu_count() or 2) - 1)
+# Topic counts scored first, log-spaced up to the requested maximum; the sweep
+# then only refines around the best of them instead of fitting every count.
+COARSE_TOPIC_POINTS: int = 5
+# Topic counts either side of the best coarse count that are also tried.
+TOPIC_REFINE_RADIUS: int = 2
+# Upper bounds on the training inputs. The sweep fits the coarse grid plus the
+# refine window, about nine models, whatever the topic count, so the largest
+# topic count only sets the size of the biggest fits. Fit time grows with
+# passes * iterations, and the caps already allow about 75 times gensim's
+# defaults (1 pass, 50 iterations), which online LDA converges well within.
+MAX_TOPICS: int = 100
+MAX_ITERATIONS: int = 199
+MAX_PASSES: int = 19
+
+
+@functools.lru_cache(maxsize=1)
+def get_stop_words() -> FrozenSet[str]:
+    """Returns the NLTK English stopwords as a frozenset, built once per process.
+
+    The words are lowercased here so they compare directly against the lowered
+    lemmas in process_corpus.
+    """
+    return frozenset(word.lower() for word in stopwords.words("english"))
+
+
+@functools.lru_cache(maxsize=1)
+def get_nlp() -> Language:
+    """Loads the spaCy pipeline once and hands back the same instance afterwards.
+
+    Only tagger, attribute_ruler and lemmatizer feed pos_/lemma_; the lemmatizer
+    needs the POS tags from attribute_ruler, so the parser and NER are dropped, as is
+    the senter that the model ships disabled but would still load.
+    The NLTK stopwords are flagged as stop words in this pipeline's vocab only,
+    so `is_stop` already marks them and they are masked out with the other
+    attribute columns; spaCy's shared English stop list is left untouched.
+
+    Returns:
+        The SPACY_MODEL pipeline without the parser, NER and senter components.
+    """
+    logger.info(f"Loading SpaCy Model {SPACY_MODEL}...")
+    nlp = spacy.load(SPACY_MODEL, exclude=["parser", "ner", "senter"])
+    stop_words = get_stop_words()
+    # Lexemes created from now on take IS_STOP from this vocab's own getter,
+    # which is pickled along with the vocab into nlp.pipe's worker processes...
+    nlp.vocab.lex_attr_getters[IS_STOP] = functools.partial(
+        is_stop, stops=frozenset(nlp.Defaults.stop_words | stop_words)
+    )
+    # ...while lexemes the model already holds keep the flag they were built with.
+    for word in stop_words:
+        for variant in (word, word.capitalize(), word.upper()):
+            nlp.vocab[variant].is_stop = True
+    return nlp
+
+
+def _isin_sorted(values: np.ndarray, sorted_ids: np.ndarray) -> np.ndarray:
+    """Tests each value for membership in a pre-sorted id array by binary search.
+
+    np.isin sorts its lookup table again on every call; the POS and stopword
+    tables are sorted once per run, so each doc only pays for the searches.
+
+    Args:
+        values: The ids to test, e.g. one column of Doc.to_array.
+        sorted_ids: The ids to test against, sorted ascending.
+
+    Returns:
+        A boolean mask, True where the value is in sorted_ids.
+    """
+    if not sorted_ids.size:
+        return np.zeros(values.shape, dtype=bool)
+    positions = np.searchsorted(sorted_ids, values)
+    positions[positions == sorted_ids.size] = 0
+    return sorted_ids[positions] == values
+
+
+def _corpus_digest(
+    texts: Iterable[str], stop_words: FrozenSet[str], removal: FrozenSet[str]
+) -> str:
+    """Fingerprints a preprocessing run by its input texts and filter settings.
+
+    Args:
+        texts: The raw documents, in corpus order.
+        stop_words: The stopwords dropped from the lemmas.
+        removal: The coarse POS tags dropped from the tokens.
+
+    Returns:
+        A hex digest naming the run's cache directory.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for setting in (SPACY_MODEL, sorted(stop_words), sorted(removal)):
+        digest.update(json.dumps(setting).encode())
+    for text in texts:
+        digest.update(text.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _prune_cache(cache_root: str, keep: int) -> None:
+    """Deletes all but the `keep` most recently used run directories of a cache.
+
+    Args:
+        cache_root: The directory holding one subdirectory per cached run.
+        keep: The number of run directories to leave in place.
+    """
+    try:
+        entries = [entry for entry in os.scandir(cache_root) if entry.is_dir()]
+    except FileNotFoundError:
+        return
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in entries[keep:]:
+        logger.debug(f"Evicting Cached Preprocessing {entry.name}")
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def _coarse_topic_grid(max_topics: int) -> List[int]:
+    """Picks the topic counts the sweep scores before refining.
+
+    Coherence changes fastest at small topic counts, so the grid is log-spaced
+    from 2 up to and including `max_topics`.
+
+    Args:
+        max_topics: The largest topic count the sweep may train.
+
+    Returns:
+        Up to COARSE_TOPIC_POINTS distinct topic counts, ascending.
+    """
+    if max_topics < 2:
+        return [max_topics]
+    return sorted(
+        set(
+            np.geomspace(2, max_topics, COARSE_TOPIC_POINTS)
+            .round()
+            .astype(int)
+            .tolist()
+        )
+    )
+
+
+def _doc2bow_chunk(
+    path: str, start: int, end: int, id2word: MappingDictionary
+) -> List[List[Tuple[int, int]]]:
+    """Converts one byte range of a JSON-lines token file to bags-of-words.
+
+    Args:
+        path: The JSON-lines file written by process_corpus.
+        start: The offset of the first document of the range.
+        end: The offset just past the last document of the range.
+        id2word: The filtered mapping dictionary.
+
+    Returns:
+        The bag-of-words of every document in the range, in file order.
+    """
+    with open(path, "rb") as tokens_file:
+        tokens_file.seek(start)
+        lines = tokens_file.read(end - start).splitlines()
+    return [id2word.doc2bow(json.loads(line)) for line in lines]
+
+
+class TokenStream:
+    """Re-iterable view over tokenized documents stored one JSON list per line.
+
+    Lets gensim walk the lemmatized corpus as many times as it needs without the
+    whole token list ever being loaded at once.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path: The JSON-lines file written by process_corpus.
+        """
+        self.path = path
+
+    def __iter__(self) -> Iterator[List[str]]:
+        with open(self.path, encoding="utf-8") as tokens_file:
+            for line in tokens_file:
+                yield json.loads(line)
+
+
+def _train_lda_model(
+    corpus: MmCorpus,
+    id2word: MappingDictionary,
+    num_of_topics: int,
+    random_state: int,
+    iterations: int,
+    passes: int,
+    chunksize: int = 2000,
+) -> LdaModel:
+    """Trains one LDA model of the sweep inside a worker process.
+
+    The corpus is an MmCorpus, which pickles as its file path and offset index,
+    so sending it with every task is cheap.
+
+    Args:
+        corpus: The bag-of-words corpus to train on.
+        id2word: The mapping dictionary for the corpus.
+        num_of_topics: The number of topics for this model.
+        random_state: The seed for the model's random state.
+        iterations: The number of iterations for the LDA model.
+        passes: The number of passes through the corpus.
+        chunksize: The number of documents per online update, gensim's 2000 by
+            default. Larger chunks mean fewer, larger matrix products per pass
+            but fewer updates, which can cost topic quality at few passes.
+
+    Returns:
+        The trained LdaModel.
+    """
+    # The sweep is already parallel across models, so each model runs on one
+    # core: plain LdaModel with single-threaded BLAS, nothing nested below it.
+    # eval_every=None skips the perplexity estimate that is only ever logged.
+    with threadpool_limits(limits=1, user_api="blas"):
+        return LdaModel(
+            corpus=corpus,
+            id2word=id2word,
+            iterations=iterations,
+            num_topics=num_of_topics,
+            passes=passes,
+            random_state=random_state,
+            chunksize=chunksize,
+            eval_every=None,
+        )
+
+
+def _sweep_coherence(
+    lda_models: List[LdaModel],
+    texts: Iterable[List[str]],
+    corpus: MmCorpus,
+    id2word: MappingDictionary,
+    coherence: str = "u_mass",
+    topn: int = 20,
+) -> List[float]:
+    """Scores every model of a sweep against one shared probability estimate.
+
+    The co-occurrence counts only depend on the corpus and on which words are
+    scored, so they are accumulated once over the top words of every model. The
+    per-topic scores of all models are then confirmed in a single call and
+    aggregated back per model. u_mass skips CoherenceModel and is
+    computed directly from the sparse corpus by _u_mass_coherence.
+
+    Args:
+        lda_models: The trained models, one per topic count.
+        texts: The tokenized documents, only read by sliding-window measures like c_v.
+        corpus: The bag-of-words corpus.
+        id2word: The mapping dictionary for the corpus.
+        coherence: The gensim coherence measure to score with.
+        topn: The number of top words per topic to score.
+
+    Returns:
+        The coherence of each model, in the order given.
+    """
+    topics_per_model = [
+        [
+            [word_id for word_id, _ in lda_model.get_topic_terms(topic, topn=topn)]
+            for topic in range(lda_model.num_topics)
+        ]
+        for lda_model in lda_models
+    ]
+    if coherence == "u_mass":
+        return _u_mass_coherence(topics_per_model, corpus, len(id2word))
+    cm = CoherenceModel(
+        topics=[topic for topics in topics_per_model for topic in topics],
+        texts=texts,
+        corpus=corpus,
+        dictionary=id2word,
+        coherence=coherence,
+        topn=topn,
+    )
+    with threadpool_limits(limits=1, user_api="blas"):
+        cm.estimate_probabilities()
+        # One confirmation pass over every topic of the sweep, so the pairwise
+        # NPMI that c_v caches per call is shared by models with common top words.
+        per_topic = cm.get_coherence_per_topic()
+    coherence_values = []
+    start = 0
+    for topics in topics_per_model:
+        end = start + len(topics)
+        coherence_values.append(cm.aggregate_measures(per_topic[start:end]))
+        start = end
+    return coherence_values
+
+
+def _u_mass_coherence(
+    topics_per_model: List[List[List[int]]],
+    corpus: MmCorpus,
+    num_terms: int,
+    eps: float = 1e-12,
+) -> List[float]:
+    """Scores u_mass coherence for every model of a sweep with sparse matrix products.
+
+    Matches CoherenceModel(coherence="u_mass"): for each pair of top words where
+    w_j ranks above w_i, log((D(w_i, w_j) / N + eps) / (D(w_j) / N)), averaged per
+    topic and then over topics. D counts documents containing the words. Here the
+    document co-occurrence counts for a model's top words come from one product of
+    a boolean term-document matrix, instead of one dictionary lookup per word pair.
+
+    Args:
+        topics_per_model: The top word ids of every topic, grouped by model.
+        corpus: The bag-of-words corpus.
+        num_terms: The size of the mapping dictionary.
+        eps: Smoothing added to the joint probability so absent pairs stay finite.
+
+    Returns:
+        The coherence of each model, in the order given.
+    """
+    occurs = (corpus2csc(corpus, num_terms=num_terms) > 0).astype(np.int32).tocsr()
+    num_docs = occurs.shape[1]
+    coherence_values = []
+    for topics in topics_per_model:
+        top_ids = np.asarray(topics)
+        unique_ids, local_ids = np.unique(top_ids, return_inverse=True)
+        local_ids = local_ids.reshape(top_ids.shape)
+        sub = occurs[unique_ids]
+        co_counts = (sub @ sub.T).toarray()
+        doc_counts = co_counts.diagonal()
+        # [topic, i, j] -> D(w_i, w_j); only pairs with j < i are scored.
+        joint = co_counts[local_ids[:, :, None], local_ids[:, None, :]]
+        conditioning = doc_counts[local_ids][:, None, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.log((joint / num_docs + eps) / (conditioning / num_docs))
+        # gensim scores a pair whose conditioning word never occurs as 0.
+        scores = np.where(conditioning > 0, scores, 0.0)
+        pairs = np.tril(np.ones(top_ids.shape[1:] * 2, dtype=bool), k=-1)
+        coherence_values.append(float(scores[:, pairs].mean(axis=1).mean()))
+    return coherence_values
+
 
 class LatentDirichletAllocator:
     """
@@ -32,67 +390,64 @@ class LatentDirichletAllocator:
     coherence values, enabling effective topic modeling on the provided corpus.
     """
 
-    def __init__(self, num_of_topics: int) -> None:
+    # Fixed attribute set: no per-instance __dict__, and a misspelt attribute
+    # raises instead of silently creating a new one.
+    __slots__ = (
+        "corpus",
+        "documents",
+        "_tokens",
+        "id2word",
+        "num_of_topics",
+        "prelemma_corpus",
+        "coherence_measure",
+        "_seeder",
+        "topics",
+        "coherence_values",
+        "best_model",
+        "_display_cache",
+    )
+
+    def __init__(self, num_of_topics: int, coherence_measure: str = "u_mass") -> None:
         """
         Initializes the LatentDirichletAllocator with a corpus and number of topics.
 
         Args:
             corpus: The text corpus to be analyzed.
             num_of_topics: The number of topics to be identified by the LDA model.
+            coherence_measure: The gensim coherence measure used to rank topic counts.
+                "u_mass" reads document co-occurrence straight from the bag-of-words
+                corpus and is an order of magnitude cheaper than "c_v", which slides
+                a window over the tokenized texts but tracks human judgement more
+                closely.
         """
         self.corpus: List[Doc] = []
         self.documents: str = ""
-        self._tokens: List[Doc] = []
+        self._tokens: Union[TokenStream, None] = None
         self.id2word: MappingDictionary = ""
         self.num_of_topics: int = num_of_topics
         self.prelemma_corpus: str = None
+        self.coherence_measure: str = coherence_measure
+        self._seeder: np.random.SeedSequence = np.random.SeedSequence()
 
         self.topics: List[str] = []
         self.coherence_values: List[float] = []
+        self.best_model: Union[LdaModel, None] = None
+        self._display_cache: Union[Tuple[LdaModel, PreparedData], None] = None
+        logger.debug(
+            f"LDA sweep runs {SWEEP_PROCESSES} processes with single-threaded BLAS"
+        )
 
-    def __getitem__(self, key):
-        return getattr(self, key)
-
-    def __setitem__(self, name: str, value) -> None:
-        return setattr(self, name, value)
-
-    def _generate_random_state(self) -> RandomState:
-        """
-        Generates a random state for model training.
-
-        Returns:
-            A RandomState object initialized with a random seed.
+    def _generate_random_state(self) -> int:
         """
-        random_seed = random.randint(1, (4294967296 - 1))
-        return RandomState(random_seed)
+        Generates a random seed for model training.
 
-    def get_lda_model(
-        self, iterations: int, workers: int, passes: int, num_of_topics: int = 0
-    ) -> LdaModel:
-        """Retrieves the LDA model based on the specified parameters.
-
-        Args:
-            iterations: The number of iterations for the LDA model.
-            workers: The number of worker threads to use.
-            passes: The number of passes through the corpus.
-            num_of_topics: The number of topics to model (defaults to instance's value).
+        Seeds are spawned from the allocator's SeedSequence, so every model gets an
+        independent stream and a run can be reproduced from the sequence's entropy.
 
         Returns:
-            An LdaModel instance configured with the provided parameters.
+            An integer seed, which gensim accepts directly as random_state.
         """
-        if num_of_topics is None:
-            num_of_topics = self.num_of_topics
-        elif workers is None:
-            workers = 4
-        return LdaMulticore(
-            corpus=self.corpus,
-            id2word=self.id2word,
-            iterations=iterations,
-            num_topics=num_of_topics,
-            workers=workers,
-            passes=passes,
-            random_state=self._generate_random_state(),
-        )
+        return int(self._seeder.spawn(1)[0].generate_state(1)[0])
 
     def visualize_results(self):
         """Visualizes the results of the LDA model and its coherence values.
@@ -102,16 +457,31 @@ class LatentDirichletAllocator:
         against the number of topics. It provides insights into the model's
         performance and helps in understanding the topic distribution.
 
+        The highest-coherence model kept by `model_trained` is displayed, so
+        nothing is retrained here, and its prepared pyLDAvis data is reused
+        until a new sweep replaces that model.
+
         Returns:
             The visualization object if successful, None otherwise.
 
         Raises:
             Exception: If there is an error during the visualization process.
         """
+        if self.best_model is None:
+            logger.warning("No Trained Model to Visualize...Train the Model First")
+            return None
         try:
-            lda_display = pyLDAvis.gensim_models.prepare(
-                self.get_lda_model(), self.corpus, self.id2word
-            )
+            if (
+                self._display_cache is None
+                or self._display_cache[0] is not self.best_model
+            ):
+                self._display_cache = (
+                    self.best_model,
+                    pyLDAvis.gensim_models.prepare(
+                        self.best_model, self.corpus, self.id2word
+                    ),
+                )
+            lda_display = self._display_cache[1]
             _ = plt.plot(self.topics, self.coherence_values)
             _ = plt.xlabel("Number of Topics")
             _ = plt.ylabel("Coherence")
@@ -121,17 +491,23 @@ class LatentDirichletAllocator:
             logger.exception("Failed to Visualize Results")
             return None
 
-    def get_top_5_topic(self):
-        """Retrieves the top five topics identified by the LDA model.
+    def get_top_5_topic(self) -> List[int]:
+        """Retrieves the five topic counts with the highest coherence.
 
-        This method returns a list containing the five most significant topics
-        based on the training results. It is useful for quickly accessing the
-        primary topics derived from the analysis.
+        This method ranks the topic counts evaluated by the sweep by their
+        coherence values and returns the best five, best first. It is useful
+        for quickly picking a number of topics to inspect.
 
         Returns:
-            A list of the top five topics.
+            Up to five topic counts, ordered by descending coherence.
         """
-        return self.topics[:5]
+        coherence = np.asarray(self.coherence_values)
+        if coherence.size <= 5:
+            best = np.argsort(-coherence)
+        else:
+            best = np.argpartition(-coherence, 5)[:5]
+            best = best[np.argsort(-coherence[best])]
+        return [self.topics[i] for i in best]
 
     class LDAModelWorker(QObject):
         preprocess_finished = pyqtSignal()
@@ -141,17 +517,34 @@ class LatentDirichletAllocator:
         _mutex = QMutex()
         error = pyqtSignal(str)
         worker_status = pyqtSignal(str)
+        # Parts of speech dropped from the corpus, and their spaCy symbol ids as
+        # matched against the POS column of Doc.to_array.
+        REMOVAL: FrozenSet[str] = frozenset(
+            ["ADV", "PRON", "PUNCT", "PART", "DET", "ADP", "SPACE", "NUM", "SYM"]
+        )
+        REMOVAL_IDS: np.ndarray = np.sort(
+            np.fromiter((POS_IDS[pos] for pos in REMOVAL), dtype=np.uint64)
+        )
+
+        def __init__(self, allocator: "LatentDirichletAllocator") -> None:
+            """
+            Args:
+                allocator: The allocator whose corpus, dictionary and sweep results
+                    the worker reads and fills in.
+            """
+            super().__init__()
+            self.allocator = allocator
 
         def _validate_inputs(
             self, number_of_topics, iterations, passes
-        ) -> Tuple[bool, Union[str, None]]:
+        ) -> Tuple[bool, str, Union[Tuple[int, int, int], None]]:
             """
             Validates the user inputs for model training parameters.
             This method checks that the inputs are integers and within acceptable ranges.
 
             The `validate_inputs` function ensures that the provided values for the number of topics, iterations,
             and passes meet the specified criteria. It returns a boolean indicating the validity of the inputs
-            along with an error message if the inputs are invalid.
+            along with an error message if the inputs are invalid, and the parsed values if they are valid.
 
             Args:
                 number_of_topics (str): The number of topics to be used in the model.
@@ -159,13 +552,28 @@ class LatentDirichletAllocator:
                 passes (str): The number of passes for the training process.
 
             Returns:
-                tuple: A tuple containing a boolean indicating validity and an error message.
+                tuple: A tuple containing a boolean indicating validity, an error message and the parsed
+                (number_of_topics, iterations, passes), or None in place of the values when invalid.
             """
-            if not all(map(str.isdigit, [number_of_topics, iterations, passes])):
-                return False, "All inputs must be integers."
-            if int(passes) >= 20 or int(iterations) >= 200:
-                return False, "Passes should be < 20 and iterations < 200."
-            return True, ""
+            try:
+                parsed = int(number_of_topics), int(iterations), int(passes)
+            except (TypeError, ValueError):
+                return False, "All inputs must be integers.", None
+            topics, iterations, passes = parsed
+            if topics <= 0 or iterations <= 0 or passes <= 0:
+                return False, "All inputs must be positive.", None
+            if (
+                topics > MAX_TOPICS
+                or iterations > MAX_ITERATIONS
+                or passes > MAX_PASSES
+            ):
+                return (
+                    False,
+                    f"Topics should be at most {MAX_TOPICS}, iterations at most "
+                    f"{MAX_ITERATIONS} and passes at most {MAX_PASSES}.",
+                    None,
+                )
+            return True, "", parsed
 
         def train_model(
             self, passes: int, iterations: int, number_of_topics: int
@@ -175,41 +583,46 @@ class LatentDirichletAllocator:
             This method validates the input values and initiates the training process if the inputs are valid.
 
             The `train_model` function retrieves user input for the number of topics, iterations, and passes,
-            validates these inputs, and then calls the model training method on the allocator instance.
-            If the training is successful, it logs a success message and presents the results.
+            validates these inputs, and then runs the topic-count sweep over the allocator's corpus.
+            If the training is successful, it logs a success message and `train_finished` tells the
+            window to present the results. Invalid inputs and failed training are reported through
+            the `error` signal for the GUI thread to display.
 
             Args:
-                    allocator (LatentDirichletAllocator): The allocator instance used for training the model.
-                Returns:
-                    None
+                passes (int): The number of passes through the corpus.
+                iterations (int): The number of iterations for the LDA model.
+                number_of_topics (int): The largest number of topics the sweep evaluates.
 
-            Raises:
-                QMessageBox: Displays a warning if the input validation fails.
+            Returns:
+                None
             """
             logger.info("Starting the Model Training.. ")
-            number_of_topics = number_of_topics
-            iterations = iterations
-            passes = passes
-
-            valid, error_message = self._validate_inputs(
+            valid, error_message, parsed = self._validate_inputs(
                 number_of_topics, iterations, passes
             )
             if not valid:
                 logger.error(error_message)
-                QMessageBox.warning(self, "Input Validation Error", error_message)
+                # The worker lives off the GUI thread; the window shows the box.
+                self.error.emit(error_message)
                 return
+            number_of_topics, iterations, passes = parsed
 
-            if self.allocator.model_trained(
+            if self.model_trained(
                 iterations=iterations,
-                workers=4,
+                workers=SWEEP_PROCESSES,
                 passes=passes,
                 num_of_topics=number_of_topics,
             ):
                 logger.success("Model successfully trained!")
-                self.present_results()
+            else:
+                self.error.emit("Model training failed; see the log for details.")
 
         def process_corpus(
-            self, nlp: Language, stopwords: List[str], wranglerInstance: DataWrangler
+            self,
+            nlp: Language,
+            stop_words: FrozenSet[str],
+            wranglerInstance: DataWrangler,
+            removal: FrozenSet[str] = REMOVAL,
         ) -> bool:
             """
             Pre-processes the data by reshaping the corpus and generating tokens from the input text.
@@ -218,8 +631,9 @@ class LatentDirichletAllocator:
 
             Args:
                 nlp (Language): The natural language processing model used for tokenization and lemmatization.
-                removal (List[str]): A list of part-of-speech tags to be excluded from the tokenization process.
+                stop_words (FrozenSet[str]): Lowercase stopwords to drop, as a set for O(1) lookups per token.
                 wranglerInstance (DataWrangler): An instance of DataWrangler used to regenerate the corpus if necessary.
+                removal (FrozenSet[str], optional): Coarse POS tags to drop, defaults to REMOVAL.
 
             Returns:
                 bool: True if the data was successfully pre-processed, False otherwise.
@@ -227,62 +641,176 @@ class LatentDirichletAllocator:
             Raises:
                 Exception: Logs an error if data processing fails.
             """
-            removal = [
-                "ADV",
-                "PRON",
-                "PUNCT",
-                "PART",
-                "DET",
-                "ADP",
-                "SPACE",
-                "NUM",
-                "SYM",
-            ]
+            removal_ids = (
+                self.REMOVAL_IDS
+                if removal is self.REMOVAL
+                else np.sort(
+                    np.fromiter((POS_IDS[pos] for pos in removal), dtype=np.uint64)
+                )
+            )
+            # Lemma hashes are plain string hashes, so stopword lemmas can be masked
+            # in the same vectorized step as POS and IS_STOP.
+            stop_lemma_ids = np.sort(
+                np.fromiter(
+                    (nlp.vocab.strings.add(word) for word in stop_words),
+                    dtype=np.uint64,
+                )
+            )
             logger.info(
                 "Configured SpaCy Model and NLTK Stopwords...Initiating Data Cleanse and Dictonary Creation"
             )
             self.worker_status.emit("Configured SpaCy Model..")
+            cache_dir = None
             try:
-                if self.prelemma_corpus is not None:
-                    self.worker_status.emit("Lemmitizing Corpus...")
-                    unprocessed_corpus = nlp.pipe(self.prelemma_corpus)
-                    for i in range(len(unprocessed_corpus)):
-                        for comment in unprocessed_corpus:
-                            proj_tok = [
-                                token.lemma_.lower()
-                                for token in comment
-                                if (
-                                    token.pos_ not in removal
-                                    and token.lemma_.lower() not in stopwords
-                                    and not token.is_stop
-                                    and token.is_alpha
-                                )
-                            ]
-                            self._tokens.append(proj_tok)
-                            self.preprocess_progress.emit(i + 1)
-                    self.worker_status.emit("Lemmatization Completed")
-                else:
+                if self.allocator.prelemma_corpus is None:
                     logger.info(
                         "Prelemma Corpus is empty. Regenerating Corpus using DataWrangler"
                     )
-                    self.prelemma_corpus = wranglerInstance.create_corpus()
-                logger.debug(f"Token Length:{len(self._tokens)}")
-                logger.info("Successfully Regenerated Corpus!...")
+                    self.allocator.prelemma_corpus = (
+                        wranglerInstance.corpus
+                        or DataWrangler.WranglerWorker(wranglerInstance).create_corpus()
+                    )
+                cache_dir = os.path.join(
+                    PREPROCESS_CACHE_DIR,
+                    _corpus_digest(self.allocator.prelemma_corpus, stop_words, removal),
+                )
+                tokens_path = os.path.join(cache_dir, "tokens.jsonl")
+                corpus_path = os.path.join(cache_dir, "corpus.mm")
+                # Saved last, so its presence marks a completed run.
+                dictionary_path = os.path.join(cache_dir, "id2word.dict")
+                if os.path.exists(dictionary_path):
+                    logger.info("Corpus Unchanged...Reusing Cached Preprocessing")
+                    # Marks the run as recently used for _prune_cache.
+                    os.utime(cache_dir)
+                    _prune_cache(PREPROCESS_CACHE_DIR, PREPROCESS_CACHE_ENTRIES)
+                    self.allocator.id2word = MappingDictionary.load(dictionary_path)
+                    self.allocator._tokens = (
+                        TokenStream(tokens_path)
+                        if self.allocator.coherence_measure in SLIDING_WINDOW_BASED
+                        else None
+                    )
+                    self.allocator.corpus = MmCorpus(corpus_path)
+                    self.preprocess_progress.emit(100)
+                    logger.success("Successfully Processed Corpus")
+                    self.preprocess_finished.emit()
+                    return True
+                os.makedirs(cache_dir, exist_ok=True)
+                # Filled in the lemmatization pass itself rather than by a second
+                # walk over every token list afterwards.
+                self.allocator.id2word = MappingDictionary()
+                # Each lemmatized document is spilled to a JSON-lines file as soon
+                # as it is counted, so only one document is held in memory at once.
+                # Offsets of every BOW_CHUNK_DOCS-th document, so the bag-of-words
+                # pass can hand each worker its own slice of the file.
+                chunk_starts = [0]
+                with open(tokens_path, "wb") as tokens_file:
+                    self.worker_status.emit("Lemmitizing Corpus...")
+                    # Lemma hash -> lowercased lemma, or None for a stopword, so
+                    # each distinct lemma is lowered and checked only once.
+                    lemma_cache: Dict[int, Union[str, None]] = {}
+                    # Exact duplicate documents are piped through spaCy once.
+                    # Counter keeps first-occurrence order, which is the order
+                    # the piped docs come back in; texts seen more than once
+                    # keep their tokens until their last copy is written.
+                    remaining = Counter(self.allocator.prelemma_corpus)
+                    unique_docs = nlp.pipe(
+                        remaining,
+                        batch_size=SPACY_BATCH_SIZE,
+                        n_process=SPACY_PROCESSES,
+                    )
+                    repeated: Dict[str, List[str]] = {}
+                    # The progress bar runs 0-100; emit only when the percentage
+                    # moves rather than one queued signal per document.
+                    total_docs = len(self.allocator.prelemma_corpus)
+                    last_percent = 0
+                    for i, text in enumerate(self.allocator.prelemma_corpus):
+                        if text in repeated:
+                            proj_tok = repeated[text]
+                        else:
+                            comment = next(unique_docs)
+                            # One (n_tokens, 4) array per doc instead of four
+                            # Python attribute lookups per token; columns are
+                            # POS, LEMMA, IS_ALPHA, IS_STOP.
+                            attrs = comment.to_array([POS, LEMMA, IS_ALPHA, IS_STOP])
+                            keep = (
+                                ~_isin_sorted(attrs[:, 0], removal_ids)
+                                & attrs[:, 2].astype(bool)
+                                & ~attrs[:, 3].astype(bool)
+                                & ~_isin_sorted(attrs[:, 1], stop_lemma_ids)
+                            )
+                            proj_tok = []
+                            # Stopwords are already masked by IS_STOP and the
+                            # lemma hashes; this catches lemmas that only match
+                            # once lowered.
+                            for lemma_id in attrs[keep, 1].tolist():
+                                if lemma_id not in lemma_cache:
+                                    lemma = nlp.vocab.strings[lemma_id].lower()
+                                    lemma_cache[lemma_id] = (
+                                        None if lemma in stop_words else lemma
+                                    )
+                                if lemma_cache[lemma_id] is not None:
+                                    proj_tok.append(lemma_cache[lemma_id])
+                            if remaining[text] > 1:
+                                repeated[text] = proj_tok
+                        remaining[text] -= 1
+                        if not remaining[text]:
+                            repeated.pop(text, None)
+                        tokens_file.write(f"{json.dumps(proj_tok)}\n".encode())
+                        if not (i + 1) % BOW_CHUNK_DOCS:
+                            chunk_starts.append(tokens_file.tell())
+                        self.allocator.id2word.doc2bow(proj_tok, allow_update=True)
+                        percent = (i + 1) * 100 // total_docs
+                        if percent != last_percent:
+                            last_percent = percent
+                            self.preprocess_progress.emit(percent)
+                    self.worker_status.emit("Lemmatization Completed")
+                    chunk_ends = chunk_starts[1:] + [tokens_file.tell()]
+                logger.debug(f"Token Length:{self.allocator.id2word.num_docs}")
                 self.worker_status.emit(
-                    f"Preparing Mapping Dictonary for {len(self._tokens)} tokens... "
+                    f"Mapping Dictonary Built with {len(self.allocator.id2word)} Terms... "
                 )
-                self.id2word = MappingDictionary(self._tokens)
                 self.worker_status.emit("Finally, Filtering Out Extremes...")
-                self.id2word.filter_extremes(no_below=5, no_above=0.5, keep_n=5000)
-                self.corpus = [self.id2word.doc2bow(doc) for doc in self._tokens]
+                self.allocator.id2word.filter_extremes(
+                    no_below=5, no_above=0.5, keep_n=5000
+                )
+                tokens = TokenStream(tokens_path)
+                # Only sliding-window coherence needs the lemma strings again.
+                self.allocator._tokens = (
+                    tokens
+                    if self.allocator.coherence_measure in SLIDING_WINDOW_BASED
+                    else None
+                )
+                # Stream the bag-of-words straight to a Matrix Market file; the
+                # sweep then reads compact sparse rows instead of tuple lists.
+                # Slices of the spill file are converted in parallel and come
+                # back in file order.
+                bow_chunks = Parallel(
+                    n_jobs=SPACY_PROCESSES, backend="loky", return_as="generator"
+                )(
+                    delayed(_doc2bow_chunk)(
+                        tokens_path, start, end, self.allocator.id2word
+                    )
+                    for start, end in zip(chunk_starts, chunk_ends)
+                )
+                MmCorpus.serialize(
+                    corpus_path,
+                    itertools.chain.from_iterable(bow_chunks),
+                    id2word=self.allocator.id2word,
+                )
+                self.allocator.corpus = MmCorpus(corpus_path)
+                self.allocator.id2word.save(dictionary_path)
+                _prune_cache(PREPROCESS_CACHE_DIR, PREPROCESS_CACHE_ENTRIES)
                 logger.debug(
-                    f"Pre-Lemma Corpus Length:{len(self.prelemma_corpus)} \n Mapping Dict: {self.id2word} \n Post Processing Corpus: {len(self.corpus)}"
+                    f"Pre-Lemma Corpus Length:{len(self.allocator.prelemma_corpus)} \n Mapping Dict: {self.allocator.id2word} \n Post Processing Corpus: {len(self.allocator.corpus)}"
                 )
                 logger.success("Successfully Processed Corpus")
                 self.preprocess_finished.emit()
                 return True
             except Exception as e:
                 logger.exception("FAILED to Process Data")
+                # A run without its dictionary would never be reused; drop it.
+                if cache_dir is not None and not os.path.exists(dictionary_path):
+                    shutil.rmtree(cache_dir, ignore_errors=True)
                 return False
 
         def preprocess_input_data(
@@ -291,9 +819,10 @@ class LatentDirichletAllocator:
             """
             Prepares the data for further processing by configuring the necessary NLP model and stopwords.
 
-            This function initializes the SpaCy language model and defines a list of parts of speech to remove during data cleansing. It then calls the `data_reshaped` method to perform the actual data reshaping and tokenization, handling any exceptions that may occur during the process.
+            This function passes the cached NLTK stopwords and the worker's POS removal set to `process_corpus`, which performs the actual data reshaping and tokenization, handling any exceptions that may occur during the process.
 
             Args:
+                nlp (Language): The natural language processing model used for tokenization and lemmatization.
                 wranglerInstance (DataWrangler, optional): An instance of DataWrangler used for data handling, defaults to None.
 
             Returns:
@@ -306,50 +835,173 @@ class LatentDirichletAllocator:
             try:
                 return self.process_corpus(
                     nlp=nlp,
-                    removal=removal,
+                    stop_words=get_stop_words(),
                     wranglerInstance=wranglerInstance,
-                    stopwords=stopwords,
+                    removal=self.REMOVAL,
                 )
             except Exception:
                 logger.exception("Failed to Preprocess Data")
                 return False
 
+        def _search_k(
+            self,
+            k_grid: Iterable[int],
+            iterations: int,
+            workers: int,
+            passes: int,
+            trained: Dict[int, Tuple[LdaModel, float]],
+            total_fits: int,
+            chunksize: int = 2000,
+        ) -> Dict[int, Tuple[LdaModel, float]]:
+            """Trains and scores the topic counts of a grid not already in `trained`.
+
+            `train_progress` is emitted with the percentage of `total_fits` done,
+            held below 100 until `model_trained` finishes the sweep.
+
+            Args:
+                k_grid: The topic counts to evaluate.
+                iterations: The number of iterations for the LDA model training.
+                workers: The number of models trained side by side.
+                passes: The number of passes through the corpus during training.
+                trained: The models and coherence values of earlier rounds, keyed
+                    by topic count; updated in place.
+                total_fits: The number of models the whole sweep is expected to fit.
+                chunksize: The number of documents per online update of each model.
+
+            Returns:
+                `trained`, with the new topic counts added.
+            """
+            topic_counts = sorted(set(k_grid) - trained.keys())
+            if not topic_counts:
+                return trained
+            random_states = [
+                self.allocator._generate_random_state() for _ in topic_counts
+            ]
+            lda_models = []
+            # loky keeps its worker processes alive between sweeps, so a
+            # retrain does not pay the process start-up cost again. It also
+            # starts them with OMP/MKL/OpenBLAS_NUM_THREADS=1, so BLAS is
+            # single-threaded in the workers before numpy is even imported.
+            with parallel_config(backend="loky", inner_max_num_threads=1), Parallel(
+                n_jobs=workers, return_as="generator_unordered"
+            ) as parallel:
+                # Largest topic counts take longest, so they are submitted
+                # first and the small ones fill in around them; models come
+                # back as they finish so progress never waits on a slow one.
+                for done, lda_model in enumerate(
+                    parallel(
+                        delayed(_train_lda_model)(
+                            self.allocator.corpus,
+                            self.allocator.id2word,
+                            num_of_topics=topic_count,
+                            random_state=random_state,
+                            iterations=iterations,
+                            passes=passes,
+                            chunksize=chunksize,
+                        )
+                        for topic_count, random_state in reversed(
+                            list(zip(topic_counts, random_states))
+                        )
+                    ),
+                    start=len(trained) + 1,
+                ):
+                    lda_models.append(lda_model)
+                    self.train_progress.emit(min(99, done * 100 // total_fits))
+
+            self.worker_status.emit("Scoring Topic Coherence...")
+            coherence_values = _sweep_coherence(
+                lda_models,
+                self.allocator._tokens,
+                self.allocator.corpus,
+                self.allocator.id2word,
+                coherence=self.allocator.coherence_measure,
+            )
+            trained.update(
+                (lda_model.num_topics, (lda_model, coherence))
+                for lda_model, coherence in zip(lda_models, coherence_values)
+            )
+            return trained
+
         def model_trained(
-            self, iterations: int, workers: int, passes: int, num_of_topics: int
+            self,
+            iterations: int,
+            workers: int,
+            passes: int,
+            num_of_topics: int,
+            chunksize: int = 2000,
         ) -> bool:
             """Trains the LDA model and evaluates coherence for a range of topic counts.
 
-            This method iteratively trains the LDA model for a specified number of
-            topics and records the coherence values for each topic count. It helps
-            in determining the optimal number of topics for the model based on
-            coherence scores.
+            A log-spaced grid of topic counts up to `num_of_topics` is trained
+            first, then the counts within `TOPIC_REFINE_RADIUS` of the best of
+            them, never above `num_of_topics`, and the coherence value of every
+            trained topic count is recorded. The models of a round
+            are independent, so they are trained concurrently in a process pool.
+            It helps in determining the optimal number of topics for the model
+            based on coherence scores.
 
             Args:
                 iterations: The number of iterations for the LDA model training.
-                workers: The number of worker threads to use during training.
+                workers: The number of models of the sweep trained side by side.
                 passes: The number of passes through the corpus during training.
-                num_of_topics: The number of topics to evaluate during training.
+                num_of_topics: The largest number of topics the sweep evaluates;
+                    the allocator's own `num_of_topics` when 0.
+                chunksize: The number of documents per online update of every
+                    model, gensim's default of 2000 unless the caller asks otherwise.
+
+            The highest-coherence model is kept as `best_model`. The cached spaCy
+            pipeline is released first; `get_nlp` reloads it if needed again.
 
             Returns:
                 True if the model is successfully trained and coherence values are
                 recorded, False otherwise.
             """
+            # The corpus is built by now. Drop the cached spaCy pipeline so its
+            # memory is back before the sweep allocates the topic matrices.
+            get_nlp.cache_clear()
+            gc.collect()
             try:
-                for i in range(1, 20):
-                    lda_model = self.get_lda_model(
-                        iterations=iterations, workers=4, passes=passes, num_of_topics=i
-                    )
-                    cm = CoherenceModel(
-                        model=lda_model,
-                        corpus=self.corpus,
-                        dictionary=self.id2word,
-                        coherence="c_v",
-                    )
-                    self.topics.append(i)
-                    self.coherence_values.append(cm.get_coherence())
-                    self.train_progress.emit(i + 1)
+                max_topics = num_of_topics or self.allocator.num_of_topics
+                coarse_grid = _coarse_topic_grid(max_topics)
+                # Every refine candidate but the best coarse count, at most.
+                total_fits = len(coarse_grid) + 2 * TOPIC_REFINE_RADIUS
+                trained = self._search_k(
+                    coarse_grid,
+                    iterations,
+                    workers,
+                    passes,
+                    trained={},
+                    total_fits=total_fits,
+                    chunksize=chunksize,
+                )
+                best_topic_count = max(trained, key=lambda k: trained[k][1])
+                self._search_k(
+                    range(
+                        max(1, best_topic_count - TOPIC_REFINE_RADIUS),
+                        min(max_topics, best_topic_count + TOPIC_REFINE_RADIUS) + 1,
+                    ),
+                    iterations,
+                    workers,
+                    passes,
+                    trained=trained,
+                    total_fits=total_fits,
+                    chunksize=chunksize,
+                )
+
+                # Each sweep replaces the last, so a retrain is never plotted
+                # or ranked together with the previous run's scores.
+                topic_counts = sorted(trained)
+                self.allocator.topics = topic_counts
+                self.allocator.coherence_values = [
+                    trained[topic_count][1] for topic_count in topic_counts
+                ]
+                # Kept for visualize_results; the rest of the sweep is dropped.
+                self.allocator.best_model = max(
+                    trained.values(), key=lambda entry: entry[1]
+                )[0]
 
                 logger.success("Successfully Trained Model")
+                self.train_progress.emit(100)
                 self.train_finished.emit()
                 return True
             except Exception as e:
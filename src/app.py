@@ -1,14 +1,10 @@
 import os
 import pathlib
 import sys
-import time
 from typing import List, Tuple, Union
 from datetime import datetime
-import gradio as gr
-from gradio import HTML, Interface, LinePlot, Row
 from loguru import logger
-from PyQt5.QtCore import QRect, pyqtSignal, QThread, QCoreApplication, QObject, QMutex
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import pyqtSignal, QThread, QObject
 from PyQt5 import QtCore
 from PyQt5.QtWidgets import (
     QApplication,
@@ -19,6 +15,7 @@ from PyQt5.QtWidgets import (
     QMainWindow,
     QMessageBox,
     QPushButton,
+    QSpinBox,
     QTextEdit,
     QVBoxLayout,
     QWidget,
@@ -27,14 +24,111 @@ from PyQt5.QtWidgets import (
     QDialog,
 )
 
-from LDA_logic import LatentDirichletAllocator, stopwords
-from utility import LogHighlighter, QTextEditStream
+from LDA_logic import (
+    get_nlp,
+    LatentDirichletAllocator,
+    MAX_ITERATIONS,
+    MAX_PASSES,
+    MAX_TOPICS,
+)
+from utility import LogHighlighter, QTextEditLogger
 from wrangler import DataWrangler
-import en_core_web_lg
 
 
-nlp = en_core_web_lg.load()
-stop_words: List[str] = stopwords.words("english")
+class ProcessDataWorker(QObject):
+    """
+    Runs the wrangling and preprocessing pipeline behind "Process Data" off the GUI thread.
+
+    Each stage reports its outcome through `stage_finished`; the worker never touches widgets, so
+    the main window updates the UI from its own thread when the signals arrive.
+
+    Signals:
+        stage_finished: Emitted with a status or error message and whether the stage succeeded.
+        finished: Emitted once with whether the whole pipeline succeeded.
+
+    Attributes:
+        wrangler (DataWrangler): The wrangler holding the selected ticket file and comments directory.
+        allocator (LatentDirichletAllocator): The allocator built from the corpus, set once `run` succeeds.
+    """
+
+    stage_finished = pyqtSignal(str, bool)
+    finished = pyqtSignal(bool)
+
+    def __init__(self, wrangler: DataWrangler) -> None:
+        super().__init__()
+        self.wrangler: DataWrangler = wrangler
+        self.allocator: LatentDirichletAllocator = None
+
+    def wrangle(self) -> Union[List[str], None]:
+        """
+        Reshapes the tickets, binds their comments, writes the JSON output and builds the corpus.
+
+        Returns:
+            The corpus, or None if a stage failed; the failure has already been reported.
+        """
+        wrangler_worker = DataWrangler.WranglerWorker(self.wrangler)
+        for stage, message in [
+            (wrangler_worker.tickets_reshaped, "Error: Failed to reshape tickets."),
+            (wrangler_worker.comments_bound, "Error: Failed to bind comments."),
+        ]:
+            if not stage():
+                self.stage_finished.emit(message, False)
+                return None
+        self.stage_finished.emit("Tickets Reshaped and Comments Bound...", True)
+
+        corpus_task = wrangler_worker.create_corpus()
+        if not corpus_task:
+            self.stage_finished.emit(
+                f"Error: Failed to create corpus. \n Corpus Type: {type(corpus_task)}",
+                False,
+            )
+            return None
+        self.stage_finished.emit("Corpus Created...", True)
+
+        self.wrangler.generate_json()
+        self.stage_finished.emit("Processed Tickets Saved...", True)
+        return corpus_task
+
+    def run(self) -> None:
+        """
+        Wrangles the selected inputs, or loads them from the cache when unchanged, and preprocesses the corpus.
+
+        Stops at the first failing stage and emits `finished` with the overall outcome.
+        """
+        try:
+            fingerprint = self.wrangler.fingerprint()
+            if self.wrangler.load_cached(fingerprint):
+                self.stage_finished.emit(
+                    "Inputs Unchanged...Loaded Cached Corpus", True
+                )
+                corpus_task = self.wrangler.corpus
+            else:
+                corpus_task = self.wrangle()
+                if corpus_task is None:
+                    self.finished.emit(False)
+                    return
+                self.wrangler.save_cache(fingerprint)
+
+            allocator = LatentDirichletAllocator(num_of_topics=30)
+            allocator.prelemma_corpus = corpus_task
+            modeler = allocator.LDAModelWorker(allocator)
+            modeler.worker_status.connect(
+                lambda message: self.stage_finished.emit(message, True)
+            )
+            if not modeler.preprocess_input_data(
+                nlp=get_nlp(), wranglerInstance=self.wrangler
+            ):
+                self.stage_finished.emit(
+                    "Error: Data preprocessing in allocator failed.", False
+                )
+                self.finished.emit(False)
+                return
+            self.allocator = allocator
+            self.finished.emit(True)
+        except Exception as e:
+            logger.exception(f"Processing failed: {e}")
+            self.stage_finished.emit(f"Unexpected error: {str(e)}", False)
+            self.finished.emit(False)
 
 
 class MainWindow(QMainWindow, QDialog):
@@ -58,9 +152,9 @@ class MainWindow(QMainWindow, QDialog):
         comments_dir_button (QPushButton): Button for selecting the comments directory.
         process_button (QPushButton): Button for processing the data.
         train_model_button (QPushButton): Button for training the model.
-        num_topics_input (QLineEdit): Input field for the number of topics.
-        iterations_input (QLineEdit): Input field for the number of iterations.
-        passes_input (QLineEdit): Input field for the number of passes.
+        num_topics_input (QSpinBox): Input field for the number of topics.
+        iterations_input (QSpinBox): Input field for the number of iterations.
+        passes_input (QSpinBox): Input field for the number of passes.
         log_output (QTextEdit): Text area for displaying log output.
     """
 
@@ -141,9 +235,8 @@ class MainWindow(QMainWindow, QDialog):
         self.train_model_button = QPushButton("Train Model")
 
         self.comments_dir.setReadOnly(True)
-        self.ticket_file.read(True)
+        self.ticket_file.setReadOnly(True)
 
-        self.ticket_file_button.fileSelected.connect(self.confirm_file_change)
         self.ticket_file_button.clicked.connect(self.select_ticket_file)
         self.comments_dir_button.clicked.connect(self.select_comments_dir)
         self.process_button.clicked.connect(self.init_start_process)
@@ -152,16 +245,20 @@ class MainWindow(QMainWindow, QDialog):
 
         # Form layout for inputs
         self.form_layout = QFormLayout()
-        self.num_topics_input = QLineEdit()
-        self.iterations_input = QLineEdit()
-        self.passes_input = QLineEdit()
+        # Spin boxes only accept integers in the ranges the worker allows, so
+        # the values never need parsing or bounds checks after a click
+        self.num_topics_input = QSpinBox()
+        self.num_topics_input.setRange(1, MAX_TOPICS)
+        self.iterations_input = QSpinBox()
+        self.iterations_input.setRange(1, MAX_ITERATIONS)
+        self.passes_input = QSpinBox()
+        self.passes_input.setRange(1, MAX_PASSES)
 
         for input_field in [
             self.num_topics_input,
             self.iterations_input,
             self.passes_input,
         ]:
-            input_field.setClearButtonEnabled(True)
             input_field.setEnabled(False)
 
         disabled_notice = QLabel(
@@ -176,8 +273,6 @@ class MainWindow(QMainWindow, QDialog):
         self.log_output = QTextEdit()
         self.log_output.setReadOnly(True)
         self.highlighter = LogHighlighter(self.log_output)
-        sys.stdout = QTextEditStream(self.log_output)
-        sys.stderr = QTextEditStream(self.log_output)
         self.log_output.setPlainText(
             f"Welcome, {os.getenv('USER', 'Learnosity Support Engineer')}!! Starting Learnosity Data Wrangler on {datetime.now().strftime('%A, %B %m, %Y')} at {datetime.now().strftime('%I:%M %p')}. \n Errors, logs and standard output will be show here... \n Well What Are You Waiting For?!?! Get to Work!"
         )
@@ -259,43 +354,51 @@ class MainWindow(QMainWindow, QDialog):
         """
         if self.pdialog is not None:
             self.pdialog.setLabelText(progress)
-            self.pdialog.setValue(self.pdialog.value + 5)
-            self.pbar.setValue(self.pbar.value + 5)
 
     def start_allocator_worker(self):
         """
         Starts the LDAModelWorker in a separate thread and connects signals to update progress.
         """
+        # Read on the GUI thread; the worker never touches widgets
+        passes = self.passes_input.value()
+        iterations = self.iterations_input.value()
+        number_of_topics = self.num_topics_input.value()
+
         # Initialize and display the progress bar
         self.show_progress_bar("Training LDA Model...")
 
         # Create a thread for the worker
         self.thread = QThread()
-        self.modeler = self.allocator.LDAModelWorker()
+        self.modeler = self.allocator.LDAModelWorker(self.allocator)
         self.modeler.moveToThread(self.thread)
 
         # Connect signals
         self.thread.started.connect(
-            lambda: self.modeler.process_corpus(
-                nlp=nlp, stopwords=stop_words, wranglerInstance=self.wrangler
+            lambda: self.modeler.train_model(
+                passes=passes,
+                iterations=iterations,
+                number_of_topics=number_of_topics,
             )
         )
-        self.modeler.preprocess_progress.connect(
-            self.update_progress_bar
+        self.modeler.train_progress.connect(
+            self.update_training_progress_bar
         )  # Update the progress bar with progress signals
         self.modeler.worker_status.connect(
-            self.update_progress_status
+            self.update_training_status
         )  # Update the progress bar with progress signals
-        self.modeler.preprocess_finished.connect(
+        self.modeler.error.connect(
+            self.on_worker_error
+        )  # Widgets are only touched from the GUI thread
+        self.modeler.train_finished.connect(
             self.on_worker_finished
         )  # Handle when the worker finishes
 
         # Start the thread
         self.thread.start()
 
-    def on_worker_finished(self):
+    def stop_allocator_worker(self) -> None:
         """
-        Handles the completion of the worker process, cleaning up the thread and closing the progress dialog.
+        Closes the progress dialog and cleans up the training thread and its worker.
         """
         self.pdialog.close()
         self.thread.quit()
@@ -303,30 +406,36 @@ class MainWindow(QMainWindow, QDialog):
         self.modeler.deleteLater()
         self.thread.deleteLater()
 
-        QMessageBox.information(
-            self, "Process Complete", "LDA Model training has finished successfully."
-        )
+    def on_worker_error(self, message: str) -> None:
+        """
+        Reports a training failure and cleans up the training thread.
 
-    def start_allocator_worker(self):
-        self.thread = QThread()
-        self.modeler = self.allocator.LDAModelWorker()
-        self.modeler.moveToThread(self.thread)
+        Args:
+            message (str): The error message emitted by the worker.
+        """
+        self.stop_allocator_worker()
+        QMessageBox.warning(self, "Model Training Error", message)
 
-        self.thread.started.connect(
-            lambda: self.modeler.data_reshaped(nlp=nlp, wranglerInstance=self.wrangler)
+    def on_worker_finished(self):
+        """
+        Handles the completion of the worker process, cleaning up the thread and presenting the results.
+        """
+        self.stop_allocator_worker()
+
+        QMessageBox.information(
+            self, "Process Complete", "LDA Model training has finished successfully."
         )
-        self.worker.preprocess_finished.connect(self.thread.quit)
-        self.worker.preprocess_finished.connect(self.worker.deleteLater)
-        self.thread.preprocess_finished.connect(self.thread.deleteLater)
-        self.worker.preprocess_progress.connect(self.reportProgress)
+        self.present_results()
 
     def init_logging(self) -> None:
         """
         Initializes the logging configuration for the application.
-        This method sets up the logger to output messages to the standard output with a specified format and log level.
+        This method sets up the logger to output messages to the log pane with a specified format and log level.
 
-        The `init_logging` method configures the logger to display messages in a colorized format that includes the timestamp,
-        log level, and message content. The logging level is set to INFO, allowing informational messages and above to be logged.
+        The `init_logging` method first removes loguru's default stderr handler, so no record is emitted twice, then adds a
+        batched `QTextEditLogger` sink for the log pane, with messages that include the timestamp, log level, and message
+        content. The logging level is set to INFO, allowing informational messages and above to be logged.
+        Standard output and error are left alone, so third-party prints never pass through the widget.
 
         Args:
             None
@@ -334,18 +443,14 @@ class MainWindow(QMainWindow, QDialog):
         Returns:
             None
         """
+        logger.remove()
         logger.level(
             "USER INPUT REQUIRED",
             no=26,
             color="<bold><blue>",
             icon="🤦🏾‍♂️",
         )
-        logger.add(
-            sys.stdout,
-            colorize=True,
-            format="{time:YYYY-MM-DD at HH:mm:ss} | {level} | {message}",
-            level="INFO",
-        )
+        self.log_sink = QTextEditLogger(self.log_output)
         logger.add(
             sink="./wrangle_log.log",
             colorize=True,
@@ -411,24 +516,24 @@ class MainWindow(QMainWindow, QDialog):
             None
 
         Raises:
-            IndexError: If there are not enough topics to display.
             FileNotFoundError: If the LDA graph file cannot be found.
         """
+        # Imported here rather than at module level, so Gradio's import cost is only paid once results are shown
+        from gradio import HTML, Interface, LinePlot, Row
+
         results_UI = Interface(
             fn=self.allocator.visualize_results(), inputs=None, outputs=["text"]
         )
         with results_UI:
             with Row():
-                try:
-                    top_topics = HTML("""<h1> Top 5 Topics</h1> <br/><ul>""")
-                    top_five_topics = self.allocator.get_top_5_topic()
-                    topics1 = HTML(f"<li>{top_five_topics[0]}</li>")
-                    topics2 = HTML(f"<li>{top_five_topics[1]}</li>")
-                    topics3 = HTML(f"<li>{top_five_topics[2]}</li>")
-                    topics4 = HTML(f"<li>{top_five_topics[3]}</li>")
-                    topics5 = HTML(f"<li>{top_five_topics[4]}</li>")
-                    end_list = HTML("</ul>")
-                except IndexError:
+                # One HTML component for the whole list instead of one per topic
+                if top_five_topics := self.allocator.get_top_5_topic():
+                    top_topics = HTML(
+                        "<h1> Top 5 Topics</h1> <br/><ul>"
+                        + "".join(f"<li>{topic}</li>" for topic in top_five_topics)
+                        + "</ul>"
+                    )
+                else:
                     top_topics = HTML(
                         """<h1> Top 5 Topics</h1>
                                         <p>Error Loading Top Five</p>
@@ -442,9 +547,8 @@ class MainWindow(QMainWindow, QDialog):
 
             with Row():
                 try:
-                    chart_html = os.path.join(pathlib.Path.cwd(), "lda_model.html")
-                    with open(chart_html, "r") as LDA_Chart_data:
-                        LDA_Chart = HTML(f"{LDA_Chart_data.read()}")
+                    chart_html = pathlib.Path.cwd() / "lda_model.html"
+                    LDA_Chart = HTML(chart_html.read_text())
                 except FileNotFoundError:
                     LDA_Chart = HTML("""<h1>Error: Loading LDA Graph </h1>""")
 
@@ -468,85 +572,86 @@ class MainWindow(QMainWindow, QDialog):
 
     def init_start_process(self) -> None:
         """
-        Initializes the data processing workflow by validating and executing the wrangling and allocation steps.
-        This function enables the necessary UI elements and logs the success or failure of the process.
+        Starts the data processing workflow in a `ProcessDataWorker` on its own thread.
 
-        The `init_start_process` method checks if the wrangler has completed the necessary preprocessing steps
-        and if the allocator has preprocessed the data. Upon successful validation, it generates a JSON output,
-        enables the training model button, and activates relevant input fields. If any step fails, it logs the error
-        and raises a RuntimeError.
+        The `init_start_process` method disables the process button, shows the progress dialog and hands the
+        wrangling and allocation steps to the worker, so the event loop keeps running while they do. Stage
+        results arrive through `on_process_stage` and the outcome through `on_process_finished`.
 
         Args:
             self.wrangler: An object responsible for data wrangling operations.
-            self.allocator: An object responsible for data allocation and preprocessing.
+        """
+        self.process_button.setEnabled(False)
+        self.show_progress_bar("Processing Data...")
 
-        Raises:
-            RuntimeError: If the data processing fails at any step.
+        # Kept on self so neither is garbage collected while the thread runs
+        self.process_thread = QThread()
+        self.process_worker = ProcessDataWorker(self.wrangler)
+        self.process_worker.moveToThread(self.process_thread)
+
+        self.process_thread.started.connect(self.process_worker.run)
+        self.process_worker.stage_finished.connect(self.on_process_stage)
+        self.process_worker.finished.connect(self.on_process_finished)
+
+        self.process_thread.start()
+
+    def on_process_stage(self, message: str, succeeded: bool) -> None:
         """
+        Reports the outcome of one processing stage on the GUI thread.
 
-        try:
-            # Collect error messages
-            error_messages = [
-                (
-                    not self.wrangler.tickets_reshaped(),
-                    "Error: Failed to reshape tickets.",
-                ),
-                (not self.wrangler.comments_bound(), "Error: Failed to bind comments."),
-            ]
-
-            # Check for errors and notify user
-            for condition, message in error_messages:
-                if condition:
-                    self.notify_user_of_error((False, message))
-                    return
+        Args:
+            message (str): The status or error message of the stage.
+            succeeded (bool): Whether the stage succeeded.
+        """
+        if succeeded:
+            logger.info(message)
+            if self.pdialog is not None:
+                self.pdialog.setLabelText(message)
+        else:
+            self.notify_user_of_error((False, message))
+
+    def on_process_finished(self, succeeded: bool) -> None:
+        """
+        Cleans up the processing thread and, on success, enables the training inputs.
 
-            # If all checks pass, proceed with JSON generation and UI adjustments
-            self.wrangler.generate_json()
-            self.allocator = LatentDirichletAllocator(num_of_topics=30)
-            corpus_task = self.wrangler.create_corpus()
+        Args:
+            succeeded (bool): Whether every processing stage succeeded.
+        """
+        self.pdialog.close()
+        self.process_thread.quit()
+        self.process_thread.wait()
+        self.process_worker.deleteLater()
+        self.process_thread.deleteLater()
 
-            if corpus_task is None or corpus_task == "":
-                self.notify_user_of_error(
-                    (
-                        False,
-                        f"Error: Failed to create corpus. \n Corpus Length: {len(corpus_task)} \n Corpus Type: {type(corpus_task)}",
-                    )
-                )
+        if not succeeded:
+            self.process_button.setEnabled(True)
+            return
 
-            if not self.allocator.data_preprocessed(wranglerInstance=self.wrangler):
-                self.notify_user_of_error(
-                    (False, "Error: Data preprocessing in allocator failed.")
-                )
-            self.allocator.prelemma_corpus = corpus_task
-            self.process_button.setEnabled(False)
-            self.train_model_button.setEnabled(True)
-
-            # Enable input fields for training parameters using a loop
-            for input_field in [
-                self.num_topics_input,
-                self.iterations_input,
-                self.passes_input,
-            ]:
-                input_field.setEnabled(True)
-
-            success_message = "The Data Located in the Provided Paths Has been Wrangled 🐄 and Massaged 💆🏽‍♂️...Please select Number of Topics, Iterations and Passes. Then Click Train Model to continue."
-            logger.success("Data successfully wrangled and saved.")
-            logger.log("USER INPUT REQUIRED", success_message)
-            QMessageBox.warning(
-                self,
-                "Data Has Successfully Processed",
-                "The Data Located in the Provided Paths Has been Wrangled and Massaged... \n\nPlease select Number of Topics, Iterations and Passes. \n Then Click Train Model to continue.",
-            )
-        except Exception as e:
-            # Notify user and log unexpected errors
-            self.notify_user_of_error((False, f"Unexpected error: {str(e)}"))
-            logger.exception(f"Processing failed: {e}")
-            raise RuntimeError("Data processing failed") from e
+        self.allocator = self.process_worker.allocator
+        self.train_model_button.setEnabled(True)
+        # The sweep searches topic counts up to this value
+        self.num_topics_input.setValue(self.allocator.num_of_topics)
 
+        # Enable input fields for training parameters using a loop
+        for input_field in [
+            self.num_topics_input,
+            self.iterations_input,
+            self.passes_input,
+        ]:
+            input_field.setEnabled(True)
+
+        success_message = "The Data Located in the Provided Paths Has been Wrangled 🐄 and Massaged 💆🏽‍♂️...Please select Number of Topics, Iterations and Passes. Then Click Train Model to continue."
+        logger.success("Data successfully wrangled and saved.")
+        logger.log("USER INPUT REQUIRED", success_message)
+        QMessageBox.warning(
+            self,
+            "Data Has Successfully Processed",
+            "The Data Located in the Provided Paths Has been Wrangled and Massaged... \n\nPlease select Number of Topics, Iterations and Passes. \n Then Click Train Model to continue.",
+        )
 
-app = QApplication(sys.argv)
-window = MainWindow("LRN Support Data Wrangler and LDA Trainer")
 
 if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    window = MainWindow("LRN Support Data Wrangler and LDA Trainer")
     window.show()
     sys.exit(app.exec_())
@@ -1,9 +1,10 @@
 import re
 import sys
+from collections import deque
 
 import validators
 from loguru import logger
-from PyQt5.QtCore import QRegExp
+from PyQt5.QtCore import QRegularExpression, QTimer
 from PyQt5.QtGui import QColor, QFont, QSyntaxHighlighter, QTextCharFormat
 
 
@@ -13,70 +14,55 @@ class QTextEditLogger:
 
     This class integrates the Loguru logging library with a QTextEdit widget,
     allowing log messages to be displayed in a graphical user interface.
+    Messages may be logged from any thread; they are queued and appended to the
+    widget in batches by a timer on the GUI thread, so a burst of log lines
+    costs one text layout rather than one per line.
     """
 
-    def __init__(self, text_edit_widget):
+    def __init__(self, text_edit_widget, flush_interval_ms: int = 100):
         """Initializes the QTextEditLogger with a QTextEdit widget.
 
+        Must be created on the GUI thread, which owns the flush timer.
+
         Args:
             text_edit_widget: The QTextEdit widget where log messages will be displayed.
+            flush_interval_ms: How often queued messages are appended, in milliseconds.
         """
         self.text_edit_widget = text_edit_widget
+        self._pending = deque()
+        self._timer = QTimer(text_edit_widget)
+        self._timer.timeout.connect(self._flush)
+        self._timer.start(flush_interval_ms)
         self._init_loguru()
 
     def _init_loguru(self):
         """Initializes the Loguru logger with a custom handler.
 
-        This method removes the default Loguru logger configuration and adds
-        a custom handler that directs log messages to the QTextEdit widget.
+        This method adds a custom handler that queues log messages for the
+        QTextEdit widget, leaving any other configured sinks in place.
         """
-        logger.remove()
         logger.add(
             self._write_to_text_edit,
-            format="{time:w} | {level} | {message}",
+            format="{time:YYYY-MM-DD at HH:mm:ss} | {level} | {message}",
             level="INFO",
         )
 
     def _write_to_text_edit(self, message):
-        """Appends a log message to the QTextEdit widget.
+        """Queues a log message for the QTextEdit widget.
 
         Args:
             message: The log message to be appended to the QTextEdit.
         """
-        self.text_edit_widget.append(message)
-
-
-# Custom class to redirect output to QTextEdit
-class QTextEditStream:
-    """A stream-like interface for appending text to a QTextEdit widget.
-
-    This class provides a way to write messages directly to a QTextEdit widget,
-    allowing for easy integration of text output in a graphical user interface.
-    """
+        self._pending.append(message.rstrip("\n"))
 
-    def __init__(self, text_edit_widget):
-        """Initializes the QTextEditStream with a QTextEdit widget.
-
-        Args:
-            text_edit_widget: The QTextEdit widget to which messages will be appended.
-        """
-        self.text_edit_widget = text_edit_widget
-
-    def write(self, message):
-        """Appends a message to the QTextEdit widget.
-
-        Args:
-            message: The message to be appended to the QTextEdit.
-        """
-        self.text_edit_widget.append(message)
-
-    def flush(self):
-        """Flushes the stream.
-
-        This method is a placeholder and does not perform any action,
-        as flushing is not necessary for this implementation.
-        """
-        pass
+    def _flush(self):
+        """Appends every queued log message to the QTextEdit widget at once."""
+        if not self._pending:
+            return
+        lines = []
+        while self._pending:
+            lines.append(self._pending.popleft())
+        self.text_edit_widget.append("\n".join(lines))
 
 
 class LogHighlighter(QSyntaxHighlighter):
@@ -95,7 +81,9 @@ class LogHighlighter(QSyntaxHighlighter):
         warning_format (QTextCharFormat): Format for WARNING log messages.
         error_format (QTextCharFormat): Format for ERROR log messages.
         debug_format (QTextCharFormat): Format for DEBUG log messages.
-        highlightingRules (list): A list of tuples containing regex patterns and their corresponding formats.
+        highlightingRules (list): A list of tuples containing compiled regex patterns and their corresponding formats.
+        level_pattern (QRegularExpression): A single pattern matching every highlighted log level.
+        level_formats (dict): The format for each log level matched by `level_pattern`.
     """
 
     def __init__(self, parent=None) -> None:
@@ -146,36 +134,49 @@ class LogHighlighter(QSyntaxHighlighter):
             QFont.Capitalization.AllUppercase
         )
         self.user_input_required_format.fontUnderline()
-        # asserting rules for each log level
+        # Compiled once here; highlightBlock runs for every line of the log pane
         self.highlightingRules = [
             (
-                QRegExp(
+                QRegularExpression(
                     r"[0-9]{4}-[0-9]{2}-[0-9]{2} ([A-Za-z0-9]+(:[A-Za-z0-9]+)+)\.[0-9]+ \| (TRACE|DEBUG|INFO|NOTICE|WARN|WARNING|ERROR|SEVERE|FATAL)\| ([A-Za-z0-9]+( [A-Za-z0-9]+)+)\.\.\.[A-Za-z0-9]+(\s+([A-Za-z]+\s+)+)[A-Za-z0-9]+"
                 ),
                 self.user_input_required_format,
             ),
             (
-                QRegExp(
+                QRegularExpression(
                     r"[0-9]{4}-[0-9]{2}-[0-9]{2} at [0-9]{2}:[0-9]{2}:+[0-9]{2}(\.[0-9]{1,3})?"
                 ),
                 self.time_format,
             ),
-            (QRegExp(r"\bINFO\b"), self.info_format),
-            (QRegExp(r"\bSUCCESS\b"), self.success_format),
-            (QRegExp(r"\bWARNING\b"), self.warning_format),
-            (QRegExp(r"\bERROR\b"), self.error_format),
-            (QRegExp(r"\bDEBUG\b"), self.debug_format),
         ]
+        # asserting rules for each log level; one alternation scans the line once
+        # and the matched level picks the format
+        self.level_formats = {
+            "INFO": self.info_format,
+            "SUCCESS": self.success_format,
+            "WARNING": self.warning_format,
+            "ERROR": self.error_format,
+            "DEBUG": self.debug_format,
+        }
+        self.level_pattern = QRegularExpression(
+            rf"\b({'|'.join(self.level_formats)})\b"
+        )
 
     def highlightBlock(self, text):
         # Apply highlighting rules to each line of the log
         for pattern, format in self.highlightingRules:
-            expression = QRegExp(pattern)
-            index = expression.indexIn(text)
-            while index >= 0:
-                length = expression.matchedLength()
-                self.setFormat(index, length, format)
-                index = expression.indexIn(text, index + length)
+            matches = pattern.globalMatch(text)
+            while matches.hasNext():
+                match = matches.next()
+                self.setFormat(match.capturedStart(), match.capturedLength(), format)
+        matches = self.level_pattern.globalMatch(text)
+        while matches.hasNext():
+            match = matches.next()
+            self.setFormat(
+                match.capturedStart(),
+                match.capturedLength(),
+                self.level_formats[match.captured(1)],
+            )
 
 
 def remove_useless_data(text: str) -> str:
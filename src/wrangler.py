@@ -1,19 +1,138 @@
+import functools
+import hashlib
 import json
 import os
 import pathlib
+import pickle
 import random
 import re
 import unicodedata
+from collections import defaultdict
 from datetime import datetime
 from enum import Enum
 from html import unescape
-from typing import List, TextIO, Tuple
+from typing import Any, BinaryIO, Iterator, List, TextIO, Tuple, Union
 
+from joblib import delayed, Parallel
 from loguru import logger
+import orjson
 import validators
 from PyQt5.QtCore import pyqtSignal, QMutex, QObject
 from PyQt5.QtWidgets import QMessageBox
 
+# Wrangled tickets and their corpus are kept here, keyed by an input fingerprint.
+WRANGLE_CACHE_DIR: pathlib.Path = pathlib.Path.cwd() / "cache"
+# Part of every fingerprint; bump it whenever Ticket, Comment or the corpus
+# format changes, so results pickled by older code are never loaded.
+WRANGLE_CACHE_VERSION: int = 1
+# Cached results kept; the least recently used beyond this are deleted on save.
+WRANGLE_CACHE_ENTRIES: int = 3
+
+# Comment files are decoded in parallel, leaving a core free for the GUI thread.
+COMMENT_PARSE_PROCESSES: int = max(1, (os.cpu_count() or 2) - 1)
+# The ticket id a comment file name starts with.
+_LEADING_TICKET_ID = re.compile(r"\d+")
+
+# Whitespace and item separators between the values of a JSON array.
+_ARRAY_SEPARATORS = re.compile(r"[\s,]*")
+_WHITESPACE = re.compile(r"\s*")
+
+
+def _iter_json_array(json_file: TextIO, chunk_size: int = 1 << 20) -> Iterator[Any]:
+    """Yields the items of a top-level JSON array one at a time.
+
+    The file is read and decoded `chunk_size` characters at a time, so only the
+    current chunk and item are held in memory instead of the whole parsed array.
+    Items are decoded with json.JSONDecoder.raw_decode and must each be followed
+    by a comma or the closing bracket. The separators themselves are read
+    leniently: repeated commas are skipped, and nothing after the closing
+    bracket is read.
+
+    Args:
+        json_file: An open text file containing a JSON array.
+        chunk_size: The number of characters read from the file at once.
+
+    Yields:
+        Each decoded item of the array, in order.
+
+    Raises:
+        json.JSONDecodeError: If the file does not hold a well-formed JSON array.
+    """
+    decoder = json.JSONDecoder()
+    buffer, position = "", 0
+    opened, exhausted, need_more = False, False, True
+    while True:
+        if need_more:
+            if exhausted:
+                raise json.JSONDecodeError("Unterminated JSON array", buffer, position)
+            chunk = json_file.read(chunk_size)
+            exhausted = not chunk
+            buffer, position, need_more = buffer[position:] + chunk, 0, False
+        position = _ARRAY_SEPARATORS.match(buffer, position).end()
+        if position == len(buffer):
+            need_more = True
+            continue
+        if not opened:
+            if buffer[position] != "[":
+                raise json.JSONDecodeError("Expecting '['", buffer, position)
+            opened, position = True, position + 1
+            continue
+        if buffer[position] == "]":
+            return
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            # The item runs past the end of the buffer
+            if exhausted:
+                raise
+            need_more = True
+            continue
+        # A number cut off by the end of the buffer decodes as a shorter one, so
+        # an item only counts once the separator or bracket after it is read.
+        following = _WHITESPACE.match(buffer, end).end()
+        if following == len(buffer) or buffer[following] not in ",]":
+            if exhausted:
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, following)
+            need_more = True
+            continue
+        yield item
+        position = end
+
+
+@functools.lru_cache(maxsize=100_000)
+def _is_identifier(line: str) -> bool:
+    """Checks whether a line is an email, URL, UUID, MD5 hash or IPv4 address.
+
+    Signatures and quoted replies repeat the same lines across tickets, so the
+    result is cached per line rather than running every validator again.
+
+    Args:
+        line: A cleaned line of a comment body.
+
+    Returns:
+        True if any of the validators accepts the line, False otherwise.
+    """
+    return bool(
+        validators.email(line)
+        or validators.url(line)
+        or validators.uuid(line)
+        or validators.hashes.md5(line)
+        or validators.ip_address.ipv4(line)
+    )
+
+
+def _load_json(path: str) -> Any:
+    """Reads and decodes one JSON file; runs in a worker process.
+
+    Args:
+        path: The path of the JSON file.
+
+    Returns:
+        The decoded JSON document.
+    """
+    with open(path, "r") as json_file:
+        return json.load(json_file)
+
 
 class MyEncoder(json.JSONEncoder):
     """Custom JSON encoder for serializing specific object types.
@@ -184,10 +303,39 @@ class DataWrangler:
             comments_dir: The directory where comment files are stored.
             ticket_file: The path to the JSON file containing ticket data.
         """
+        self.wrangled_tickets: List[Ticket] = []
+        self.corpus: List[str] = []
+        # The last wrangling stage completed for the current inputs:
+        # 0 nothing, 1 tickets reshaped, 2 comments bound.
+        self._stage: int = 0
         self.ticket_file = ticket_file
         self.comments_dir = comments_dir
-        self.wrangled_tickets: List[Ticket] = []
-        self.corpus: str = ""
+
+    @property
+    def ticket_file(self) -> pathlib.Path:
+        """The path to the JSON file containing ticket data."""
+        return self._ticket_file
+
+    @ticket_file.setter
+    def ticket_file(self, path: pathlib.Path) -> None:
+        self._ticket_file = path
+        self._reset_stages()
+
+    @property
+    def comments_dir(self) -> pathlib.Path:
+        """The directory where comment files are stored."""
+        return self._comments_dir
+
+    @comments_dir.setter
+    def comments_dir(self, path: pathlib.Path) -> None:
+        self._comments_dir = path
+        self._reset_stages()
+
+    def _reset_stages(self) -> None:
+        """Discards wrangled results so new inputs are wrangled from scratch."""
+        self.wrangled_tickets = []
+        self.corpus = []
+        self._stage = 0
 
     def __getitem__(self, key):
         return getattr(self, key)
@@ -195,6 +343,86 @@ class DataWrangler:
     def __setitem__(self, name: str, value) -> None:
         return setattr(self, name, value)
 
+    def fingerprint(self) -> str:
+        """Fingerprints the selected inputs by path, modification time and size.
+
+        The ticket file and every entry of the comments directory are covered, so
+        editing, adding or removing any of them yields a new fingerprint without
+        reading their contents. WRANGLE_CACHE_VERSION is covered as well.
+
+        Returns:
+            A hex digest identifying the current inputs.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{WRANGLE_CACHE_VERSION}\0".encode())
+        ticket_stat = os.stat(self.ticket_file)
+        digest.update(
+            f"{os.path.abspath(self.ticket_file)}\0{ticket_stat.st_mtime_ns}\0{ticket_stat.st_size}\0".encode()
+        )
+        digest.update(f"{os.path.abspath(self.comments_dir)}\0".encode())
+        with os.scandir(self.comments_dir) as entries:
+            for entry in sorted(entries, key=lambda entry: entry.name):
+                entry_stat = entry.stat()
+                digest.update(
+                    f"{entry.name}\0{entry_stat.st_mtime_ns}\0{entry_stat.st_size}\0".encode()
+                )
+        return digest.hexdigest()
+
+    def load_cached(self, fingerprint: str) -> bool:
+        """Restores the wrangled tickets and corpus saved for a fingerprint.
+
+        Args:
+            fingerprint: The fingerprint of the current inputs.
+
+        Returns:
+            True if a cached result was found and loaded, False otherwise.
+        """
+        cache_path = WRANGLE_CACHE_DIR / f"{fingerprint}.corpus.pkl"
+        if not cache_path.exists():
+            return False
+        try:
+            with open(cache_path, "rb") as cache_file:
+                self.wrangled_tickets, self.corpus = pickle.load(cache_file)
+        except Exception:
+            logger.exception(f"Discarding Unreadable Cached Corpus {cache_path}")
+            cache_path.unlink(missing_ok=True)
+            self._reset_stages()
+            return False
+        # Marks the entry as recently used for the eviction in save_cache.
+        os.utime(cache_path)
+        self._stage = 2
+        logger.info(f"Inputs Unchanged...Loaded Cached Corpus {cache_path}")
+        return True
+
+    def save_cache(self, fingerprint: str) -> None:
+        """Saves the wrangled tickets and corpus under a fingerprint.
+
+        All but the WRANGLE_CACHE_ENTRIES most recently used results are deleted.
+
+        Args:
+            fingerprint: The fingerprint of the inputs they were built from.
+        """
+        WRANGLE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path = WRANGLE_CACHE_DIR / f"{fingerprint}.corpus.pkl"
+        # Written under a temporary name first, so an interrupted save is never
+        # mistaken for a complete one.
+        partial_path = cache_path.with_suffix(".partial")
+        with open(partial_path, "wb") as cache_file:
+            pickle.dump(
+                (self.wrangled_tickets, self.corpus),
+                cache_file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(partial_path, cache_path)
+        cached = sorted(
+            WRANGLE_CACHE_DIR.glob("*.corpus.pkl"),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+        for stale_path in cached[WRANGLE_CACHE_ENTRIES:]:
+            logger.debug(f"Evicting Cached Corpus {stale_path}")
+            stale_path.unlink(missing_ok=True)
+
     @staticmethod
     def reshaped_comment(comment) -> Comment:
         """Reshapes a comment dictionary into a Comment object.
@@ -226,7 +454,8 @@ class DataWrangler:
     def generate_json(
         self,
         filename: str = f"processed_tickets{datetime.now().strftime('%Y-%m-%d')}.json",
-    ) -> Tuple[TextIO, TextIO]:
+        indent: bool = True,
+    ) -> Tuple[BinaryIO, BinaryIO]:
         """
         Generates JSON files for processed tickets and the associated corpus.
 
@@ -234,9 +463,10 @@ class DataWrangler:
 
         Args:
             filename (str, optional): The name of the output file for processed tickets. Defaults to "processed_tickets" followed by the current date.
+            indent (bool, optional): Whether both files are indented by two spaces, defaults to True. False writes compact JSON.
 
         Returns:
-            Tuple[TextIO, TextIO]: A tuple containing the file handles for the processed tickets and the corpus JSON files.
+            Tuple[BinaryIO, BinaryIO]: A tuple containing the file handles for the processed tickets and the corpus JSON files.
 
         Raises:
             IOError: If there is an issue opening or writing to the output files.
@@ -257,24 +487,27 @@ class DataWrangler:
             return os.path.join(pathlib.Path.cwd(), "completed", filename)
 
         filename = construct_path(filename)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
         corpus_filename = construct_path(
             f"corpus_{datetime.now().strftime('%Y-%m-%d')}.json"
         )
 
-        with open(filename, "w+") as output1:
-            json.dump(
-                [ticket.__dict__ for ticket in self.wrangled_tickets],
-                output1,
-                indent=4,
-                cls=MyEncoder,
-            )
-
-            with open(corpus_filename, "w+") as output2:
-                json.dump(
-                    self.corpus,
-                    output2,
-                    indent=4,
-                    cls=MyEncoder,
+        encoder = MyEncoder()
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        # orjson writes enums as their values by itself, so statuses are encoded
+        # up front to keep MyEncoder's {"status": name} form.
+        tickets = [
+            {**ticket.__dict__, "status": encoder.default(ticket.status)}
+            for ticket in self.wrangled_tickets
+        ]
+        with open(filename, "wb") as output1:
+            output1.write(orjson.dumps(tickets, default=encoder.default, option=option))
+
+            with open(corpus_filename, "wb") as output2:
+                output2.write(
+                    orjson.dumps(self.corpus, default=encoder.default, option=option)
                 )
             return (output1, output2)
 
@@ -311,42 +544,40 @@ class DataWrangler:
         error = pyqtSignal(str)
         worker_status = pyqtSignal(str)
 
+        def __init__(self, wrangler: "DataWrangler") -> None:
+            """
+            Args:
+                wrangler: The wrangler whose inputs the worker reads and whose
+                    tickets, corpus and stage it fills in.
+            """
+            super().__init__()
+            self.wrangler = wrangler
+
         def _cleanse(self, body_of_text: str) -> str:
-            """Cleanses the provided text by normalizing and unescaping each line"""
-            check_body = body_of_text.splitlines()
-            cleaned_lines = [
-                unicodedata.normalize("NFKC", unescape(line))
-                .replace("\n", " ")
-                .replace("\r", " ")
-                for line in check_body
-            ]
-            for line in cleaned_lines:
-                if not line.isalnum():
-                    cleaned_lines.remove(line)
-
-            scrubbed = [
-                word
-                for word in cleaned_lines
-                if not any(
-                    [
-                        validators.email(word),
-                        validators.url(word),
-                        validators.uuid(word),
-                        validators.hashes.md5(word),
-                        validators.ip_address.ipv4(word),
-                    ]
-                )
-            ]
-            logger.success("Successfully Cleansed Corpus")
-            return scrubbed
+            """Cleanses the provided text by normalizing and unescaping each line.
+
+            Blank lines and lines holding only an email, URL, UUID, MD5 hash or IPv4
+            address are dropped, and the remaining lines are joined with spaces.
+            """
+            cleaned_lines = (
+                unicodedata.normalize("NFKC", unescape(line)).strip()
+                for line in body_of_text.splitlines()
+            )
+            return " ".join(
+                line for line in cleaned_lines if line and not _is_identifier(line)
+            )
 
         def comments_bound(self) -> bool:
             """Binds comments from files to their corresponding tickets.
 
-            This method iterates through the wrangled tickets and attempts to match
-            comments stored in files within a specified directory. It loads the comments
-            associated with each ticket, reshapes them, and appends them to the ticket's
-            comments list, logging the process and any issues encountered.
+            This method lists the comments directory once, matches each file to the
+            wrangled ticket whose id its name starts with, and decodes the files in
+            a process pool. It reshapes the comments associated with each ticket and
+            appends them to the ticket's comments list, logging the process and any
+            issues encountered.
+
+            Comments already bound for the current inputs are not bound again, and
+            nothing is bound before `tickets_reshaped` has succeeded.
 
             Returns:
                 True if comments are successfully bound to the tickets, False otherwise.
@@ -354,96 +585,155 @@ class DataWrangler:
             Raises:
                 Exception: If there is an error during the binding process.
             """
+            if self.wrangler._stage >= 2:
+                return True
+            if self.wrangler._stage < 1:
+                logger.error("Tickets must be reshaped before comments are bound")
+                return False
             try:
-                for ticket in self.wrangled_tickets:
-                    self.worker_status.emit(
-                        "Collecting Ticket Objects for Comment Binding..."
-                    )
-                    comments_found = False
-                    for i in range(len(os.listdir(self.comment_dir))):
-                        self.worker_status.emit(
-                            f'Binding Comments for Ticket {ticket["id"]}'
+                self.worker_status.emit(
+                    "Collecting Ticket Objects for Comment Binding..."
+                )
+                # One listing of the directory, grouped by the ticket id each file
+                # name starts with, instead of a listing per ticket.
+                files_by_ticket = defaultdict(list)
+                for filename in sorted(os.listdir(self.wrangler.comments_dir)):
+                    if ticket_id := _LEADING_TICKET_ID.match(filename):
+                        files_by_ticket[ticket_id.group()].append(
+                            os.path.join(self.wrangler.comments_dir, filename)
                         )
-                        for filename in os.listdir(self.comments_dir):
-                            if filename.startswith(str(ticket.id)):
-                                comments_file_path = os.path.join(
-                                    self.comments_dir, filename
+                comment_files = [
+                    files_by_ticket.get(str(ticket.id), [])
+                    for ticket in self.wrangler.wrangled_tickets
+                ]
+
+                # The files are decoded in parallel and come back in submission
+                # order, so they are bound ticket by ticket as they arrive.
+                decoded_files = Parallel(
+                    n_jobs=COMMENT_PARSE_PROCESSES,
+                    backend="loky",
+                    return_as="generator",
+                )(
+                    delayed(_load_json)(path)
+                    for paths in comment_files
+                    for path in paths
+                )
+                for i, (ticket, paths) in enumerate(
+                    zip(self.wrangler.wrangled_tickets, comment_files), start=1
+                ):
+                    self.worker_status.emit(f"Binding Comments for Ticket {ticket.id}")
+                    comments_found = False
+                    for _ in paths:
+                        comments_data = next(decoded_files)
+                        logger.info(f"Binding comments for ticket {ticket.id}")
+                        for key, value in comments_data.items():
+                            for comment in value:
+                                reshaped_comment = self.wrangler.reshaped_comment(
+                                    comment
                                 )
-                                logger.info(f"Binding comments for ticket {ticket.id}")
-                                with open(comments_file_path, "r") as comments_file:
-                                    comments_data = json.load(comments_file)
-                                    for key, value in comments_data.items():
-                                        for comment in value:
-                                            reshaped_comment = self.reshaped_comment(
-                                                comment
-                                            )
-                                            ticket.comments.append(
-                                                reshaped_comment.to_dict_format()
-                                            )
-                                            comments_found = True
-                                            self.binding_progress.emit(i + 1)
-                            if not comments_found:
-                                logger.warning(
-                                    f"No comments found for ticket {ticket.id}"
+                                ticket.comments.append(
+                                    reshaped_comment.to_dict_format()
                                 )
-                                self.binding_progress.emit(i + 1)
-                    logger.success(f"Comments bound to ticket {ticket.id}")
-                    return True
+                                comments_found = True
+                    if comments_found:
+                        logger.success(f"Comments bound to ticket {ticket.id}")
+                    else:
+                        logger.warning(f"No comments found for ticket {ticket.id}")
+                    self.binding_progress.emit(i)
+                self.wrangler._stage = 2
+                return True
             except (FileNotFoundError, json.JSONDecodeError) as e:
                 logger.exception(f"Error while binding comments: {e}")
+                # Some tickets may hold part of their comments; reshape them afresh
+                self.wrangler._stage = 0
                 return False
 
         def tickets_reshaped(self) -> bool:
             """Reshapes ticket data from a JSON file into Ticket objects.
 
-                This method reads ticket data from a specified JSON file and converts
-                each ticket into a Ticket object, including associated comments. It
-                logs the success of each reshaping operation and returns a boolean
-                indicating the overall success of the process.
+            This method streams ticket data from a specified JSON file and converts
+            each ticket into a Ticket object, including associated comments. Tickets
+            are decoded one at a time, so the raw export is never held in memory as a
+            whole. It logs the success of each reshaping operation and returns a
+            boolean indicating the overall success of the process.
 
-                Returns:
-                    True if all tickets are successfully reshaped and added to the
-                    wrangled tickets list, False otherwise.
+            Tickets already reshaped from the current inputs are kept, and the call
+            returns True straight away.
+
+            Returns:
+                True if all tickets are successfully reshaped and added to the
+                wrangled tickets list, False otherwise.
 
             Raises:
                 Exception: If there is an error during the reading or reshaping
                 process.
             """
+            if self.wrangler._stage >= 1:
+                return True
+            try:
+                # A failed earlier attempt may have left some tickets behind
+                self.wrangler.wrangled_tickets = []
+                with open(self.wrangler.ticket_file, "r") as tickets_file:
+                    for ticket in _iter_json_array(tickets_file):
+                        reshaped_ticket = Ticket(
+                            id=ticket["id"],
+                            created_at=datetime.strptime(
+                                ticket["created_at"], "%Y-%m-%dT%H:%M:%SZ"
+                            ),
+                            last_updated=datetime.strptime(
+                                ticket["updated_at"], "%Y-%m-%dT%H:%M:%SZ"
+                            ),
+                            subject=ticket["subject"],
+                            tags=ticket.get("tags", []),
+                            outcome=ticket["fields"][2]["value"],
+                            ticket_type=ticket["fields"][0]["value"],
+                            status=TicketStatus[ticket["status"].upper()],
+                        )
+                        first_comment = Comment(
+                            id=random.randint(9999, 9999999999999),
+                            created_at=datetime.strptime(
+                                ticket["created_at"], "%Y-%m-%dT%H:%M:%SZ"
+                            ),
+                            body=ticket["description"],
+                        )
+                        reshaped_ticket.comments.append(first_comment)
+                        logger.success(f"Successfully reshaped ticket {ticket['id']}")
+                        self.wrangler.wrangled_tickets.append(reshaped_ticket)
+                        logger.info(
+                            f"Appended ticket {ticket['id']} to wrangled_tickets property on the caller object"
+                        )
+                        logger.debug(
+                            f" Length of Wrangled Tickets: {len(self.wrangler.wrangled_tickets)} \n Wrangled Tickets: {[ticket.__str__() for ticket in self.wrangler.wrangled_tickets]}"
+                        )
+                self.wrangler._stage = 1
+                return True
+            except Exception as e:
+                logger.exception(f"Failed to reshape tickets: {e}")
+                return False
 
-        try:
-            with open(self.ticket_file, "r") as tickets_file:
-                tickets_data = json.load(tickets_file)
-                for ticket in tickets_data:
-                    reshaped_ticket = Ticket(
-                        id=ticket["id"],
-                        created_at=datetime.strptime(
-                            ticket["created_at"], "%Y-%m-%dT%H:%M:%SZ"
-                        ),
-                        last_updated=datetime.strptime(
-                            ticket["updated_at"], "%Y-%m-%dT%H:%M:%SZ"
-                        ),
-                        subject=ticket["subject"],
-                        tags=ticket.get("tags", []),
-                        outcome=ticket["fields"][2]["value"],
-                        ticket_type=ticket["fields"][0]["value"],
-                        status=TicketStatus[ticket["status"].upper()],
-                    )
-                    first_comment = Comment(
-                        id=random.randint(9999, 9999999999999),
-                        created_at=datetime.strptime(
-                            ticket["created_at"], "%Y-%m-%dT%H:%M:%SZ"
-                        ),
-                        body=ticket["description"],
-                    )
-                    reshaped_ticket.comments.append(first_comment)
-                    logger.success(f"Successfully reshaped ticket {ticket['id']}")
-                    self.wrangled_tickets.append(reshaped_ticket)
-                    logger.info(
-                        f"Appended ticket {ticket['id']} to wrangled_tickets property on the caller object"
-                    )
-                    logger.debug(
-                        f" Length of Wrangled Tickets: {len(self.wrangled_tickets)} \n Wrangled Tickets: {[ticket.__str__() for ticket in self.wrangled_tickets]}"
-                    )
-            return True
-        except Exception as e:
-            logger.exception(f"Failed to reshape tickets: {e}")
+        def create_corpus(self) -> List[str]:
+            """Creates a text corpus from the wrangled tickets and their comments.
+
+            Each ticket becomes one document: its subject followed by the body of
+            every comment bound to it, cleansed by `_cleanse`.
+
+            Returns:
+                One document per wrangled ticket, in ticket order, also kept as the
+                wrangler's `corpus`.
+            """
+            self.worker_status.emit("Creating Corpus from Wrangled Tickets...")
+            corpus = []
+            for i, ticket in enumerate(self.wrangler.wrangled_tickets, start=1):
+                # The description is kept as a Comment, bound comments as dicts.
+                bodies = [
+                    comment.body if isinstance(comment, Comment) else comment["body"]
+                    for comment in ticket.comments
+                ]
+                corpus.append(
+                    self._cleanse("\n".join(filter(None, [ticket.subject, *bodies])))
+                )
+                self.corpus_creation_progress.emit(i)
+            self.wrangler.corpus = corpus
+            logger.success(f"Created Corpus of {len(corpus)} Documents")
+            self.corpus_creation_finished.emit()
+            return corpus
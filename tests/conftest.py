@@ -0,0 +1,34 @@
+import os
+import sys
+
+import pytest
+import spacy
+from spacy.language import Language
+
+# The app imports its modules top-level from src (`from wrangler import ...`).
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@Language.component("fixture_tagger")
+def fixture_tagger(doc):
+    """Tags punctuation and numbers like the real tagger and strips plural s."""
+    for token in doc:
+        if token.is_punct:
+            token.pos_ = "PUNCT"
+        elif token.like_num:
+            token.pos_ = "NUM"
+        elif token.lower_ in {"the", "their"}:
+            token.pos_ = "DET"
+        else:
+            token.pos_ = "NOUN"
+        token.lemma_ = token.text.rstrip("s") if len(token.text) > 3 else token.text
+    return doc
+
+
+@pytest.fixture(scope="session")
+def nlp():
+    """A blank English pipeline standing in for the full spaCy model."""
+    pipeline = spacy.blank("en")
+    pipeline.add_pipe("fixture_tagger")
+    return pipeline
@@ -0,0 +1,140 @@
+import json
+
+import pytest
+
+import app
+import LDA_logic
+import wrangler
+from wrangler import DataWrangler
+
+THEMES = [
+    ["question", "editor", "render", "blank", "preview"],
+    ["login", "session", "timeout", "browser", "cookie"],
+    ["score", "report", "export", "grade", "attempt"],
+]
+
+
+@pytest.fixture
+def pipeline_inputs(tmp_path, monkeypatch):
+    """Two dozen tickets over three themes, each with one bound comment file."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(wrangler, "WRANGLE_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(wrangler, "COMMENT_PARSE_PROCESSES", 1)
+    monkeypatch.setattr(LDA_logic, "PREPROCESS_CACHE_DIR", str(tmp_path / "lda"))
+    monkeypatch.setattr(LDA_logic, "SPACY_PROCESSES", 1)
+    monkeypatch.setattr(LDA_logic, "SWEEP_PROCESSES", 1)
+    monkeypatch.setattr(LDA_logic, "get_stop_words", lambda: frozenset({"the"}))
+
+    tickets = []
+    comments_dir = tmp_path / "comments"
+    comments_dir.mkdir()
+    for ticket_id in range(1, 25):
+        theme = THEMES[ticket_id % len(THEMES)]
+        tickets.append(
+            {
+                "id": ticket_id,
+                "created_at": "2024-03-01T09:30:00Z",
+                "updated_at": "2024-03-02T16:00:00Z",
+                "subject": f"The {theme[0]} {theme[ticket_id % 5]}",
+                "fields": [{"value": "problem"}, {"value": None}, {"value": "fixed"}],
+                "status": "solved",
+                "description": " ".join(theme) + "\nsupport@example.com",
+            }
+        )
+        (comments_dir / f"{ticket_id}.json").write_text(
+            json.dumps(
+                {
+                    "comments": [
+                        {
+                            "id": ticket_id * 100,
+                            "created_at": "2024-03-01T10:00:00Z",
+                            "plain_body": " ".join(reversed(theme)),
+                        }
+                    ]
+                }
+            )
+        )
+    ticket_file = tmp_path / "tickets.json"
+    ticket_file.write_text(json.dumps(tickets))
+    return DataWrangler(comments_dir=comments_dir, ticket_file=ticket_file)
+
+
+def test_process_data_then_train_end_to_end(pipeline_inputs, nlp, monkeypatch):
+    monkeypatch.setattr(app, "get_nlp", lambda: nlp)
+    worker = app.ProcessDataWorker(pipeline_inputs)
+    stages, outcome = [], []
+    worker.stage_finished.connect(lambda message, ok: stages.append((message, ok)))
+    worker.finished.connect(outcome.append)
+
+    worker.run()
+
+    assert outcome == [True], stages
+    assert all(ok for _, ok in stages)
+    assert len(pipeline_inputs.corpus) == 24
+    # Identifier-only lines such as signature emails are cleansed out.
+    assert not any("@" in document for document in pipeline_inputs.corpus)
+    # Subject, description, then the bound comment, one document per ticket.
+    assert pipeline_inputs.corpus[0] == (
+        "The login session "
+        "login session timeout browser cookie "
+        "cookie browser timeout session login"
+    )
+
+    allocator = worker.allocator
+    assert len(allocator.corpus) == 24
+    assert len(allocator.id2word)
+
+    modeler = allocator.LDAModelWorker(allocator)
+    finished = []
+    modeler.train_finished.connect(lambda: finished.append(True))
+    modeler.train_model(passes=1, iterations=5, number_of_topics=4)
+
+    assert finished == [True]
+    assert allocator.best_model is not None
+    assert allocator.topics and max(allocator.topics) <= 4
+
+
+def test_second_run_with_same_inputs_skips_wrangling(pipeline_inputs, nlp, monkeypatch):
+    monkeypatch.setattr(app, "get_nlp", lambda: nlp)
+    first = app.ProcessDataWorker(pipeline_inputs)
+    first.run()
+    assert first.allocator is not None
+
+    def fail_if_called(*args, **kwargs):
+        raise AssertionError("inputs were wrangled again")
+
+    monkeypatch.setattr(DataWrangler.WranglerWorker, "tickets_reshaped", fail_if_called)
+    monkeypatch.setattr(DataWrangler.WranglerWorker, "comments_bound", fail_if_called)
+    rerun = DataWrangler(
+        comments_dir=pipeline_inputs.comments_dir,
+        ticket_file=pipeline_inputs.ticket_file,
+    )
+    second = app.ProcessDataWorker(rerun)
+    stages, outcome = [], []
+    second.stage_finished.connect(lambda message, ok: stages.append((message, ok)))
+    second.finished.connect(outcome.append)
+
+    second.run()
+
+    assert outcome == [True], stages
+    assert stages[0] == ("Inputs Unchanged...Loaded Cached Corpus", True)
+    assert rerun.corpus == pipeline_inputs.corpus
+    assert [ticket.id for ticket in rerun.wrangled_tickets] == list(range(1, 25))
+
+
+def test_retraining_replaces_the_previous_sweep(pipeline_inputs, nlp, monkeypatch):
+    monkeypatch.setattr(app, "get_nlp", lambda: nlp)
+    worker = app.ProcessDataWorker(pipeline_inputs)
+    worker.run()
+    allocator = worker.allocator
+    modeler = allocator.LDAModelWorker(allocator)
+
+    assert modeler.model_trained(iterations=5, workers=1, passes=1, num_of_topics=4)
+    first_topics = list(allocator.topics)
+    assert modeler.model_trained(iterations=5, workers=1, passes=1, num_of_topics=6)
+
+    assert allocator.topics == sorted(set(allocator.topics))
+    assert len(allocator.coherence_values) == len(allocator.topics)
+    assert max(allocator.topics) == 6 and allocator.topics != first_topics
+    top_topics = allocator.get_top_5_topic()
+    assert len(top_topics) == len(set(top_topics))
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+from gensim.corpora.dictionary import Dictionary as MappingDictionary
+from gensim.models import CoherenceModel
+from gensim.models.ldamodel import LdaModel
+
+from LDA_logic import _sweep_coherence
+
+
+@pytest.fixture(scope="module")
+def sweep():
+    rng = random.Random(0)
+    vocab = [f"term{i}" for i in range(60)]
+    # Three loose themes, so the models' top words overlap without matching.
+    texts = [
+        [rng.choice(vocab[(d % 3) * 20 : (d % 3) * 20 + 30]) for _ in range(30)]
+        for d in range(90)
+    ]
+    id2word = MappingDictionary(texts)
+    corpus = [id2word.doc2bow(text) for text in texts]
+    lda_models = [
+        LdaModel(
+            corpus=corpus,
+            id2word=id2word,
+            num_topics=num_topics,
+            passes=2,
+            iterations=20,
+            random_state=num_topics,
+        )
+        for num_topics in (2, 3, 5)
+    ]
+    return lda_models, texts, corpus, id2word
+
+
+@pytest.mark.parametrize("coherence", ["u_mass", "c_v"])
+def test_shared_accumulator_matches_per_model_coherence(sweep, coherence):
+    lda_models, texts, corpus, id2word = sweep
+    expected = [
+        CoherenceModel(
+            model=lda_model,
+            texts=texts,
+            corpus=corpus,
+            dictionary=id2word,
+            coherence=coherence,
+            topn=20,
+        ).get_coherence()
+        for lda_model in lda_models
+    ]
+
+    assert _sweep_coherence(
+        lda_models, texts, corpus, id2word, coherence=coherence
+    ) == pytest.approx(expected, rel=1e-9, abs=1e-12)
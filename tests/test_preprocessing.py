@@ -0,0 +1,89 @@
+import random
+
+import pytest
+from gensim.corpora.dictionary import Dictionary as MappingDictionary
+
+import LDA_logic
+from LDA_logic import LatentDirichletAllocator
+
+STOP_WORDS = frozenset({"the", "their", "because", "always", "and", "were"})
+CONTENT_WORDS = [
+    "widget",
+    "Widgets",
+    "river",
+    "Rivers",
+    "server",
+    "login",
+    "Logins",
+    "timeout",
+    "browser",
+    "render",
+    "renders",
+    "question",
+    "Questions",
+    "score",
+    "scores",
+    "report",
+    "item",
+    "items",
+    "session",
+    "export",
+]
+
+
+@pytest.fixture(scope="module")
+def texts():
+    rng = random.Random(0)
+    documents = [
+        " ".join(rng.choice(CONTENT_WORDS) for _ in range(8))
+        # "Theirs" only becomes a stopword once lemmatized and lowered.
+        + " . The Rivers were 42 and Theirs , Because ALWAYS"
+        for _ in range(40)
+    ]
+    # Exact duplicates are lemmatized once and must still appear in order.
+    return documents + documents[:10] + documents[3:5]
+
+
+def baseline_corpus(nlp, texts, removal):
+    """The token filter and dictionary build process_corpus started from."""
+    tokens = [
+        [
+            token.lemma_.lower()
+            for token in comment
+            if (
+                token.pos_ not in removal
+                and token.lemma_.lower() not in STOP_WORDS
+                and not token.is_stop
+                and token.is_alpha
+            )
+        ]
+        for comment in nlp.pipe(texts)
+    ]
+    id2word = MappingDictionary(tokens)
+    id2word.filter_extremes(no_below=5, no_above=0.5, keep_n=5000)
+    return tokens, id2word, [id2word.doc2bow(doc) for doc in tokens]
+
+
+@pytest.mark.parametrize("bow_chunk_docs", [5000, 7])
+def test_process_corpus_matches_baseline_filter(
+    nlp, texts, tmp_path, monkeypatch, bow_chunk_docs
+):
+    monkeypatch.setattr(LDA_logic, "PREPROCESS_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(LDA_logic, "SPACY_PROCESSES", 1)
+    monkeypatch.setattr(LDA_logic, "BOW_CHUNK_DOCS", bow_chunk_docs)
+    removal = LatentDirichletAllocator.LDAModelWorker.REMOVAL
+    tokens, id2word, corpus = baseline_corpus(nlp, texts, removal)
+    assert len(id2word)
+
+    # c_v keeps the token stream, so the lemmas can be compared as well.
+    allocator = LatentDirichletAllocator(num_of_topics=3, coherence_measure="c_v")
+    allocator.prelemma_corpus = texts
+    worker = allocator.LDAModelWorker(allocator)
+    assert worker.process_corpus(nlp=nlp, stop_words=STOP_WORDS, wranglerInstance=None)
+
+    assert list(allocator._tokens) == tokens
+    assert allocator.id2word.token2id == id2word.token2id
+    assert [
+        [(int(word_id), int(count)) for word_id, count in doc]
+        for doc in allocator.corpus
+    ] == corpus
@@ -0,0 +1,183 @@
+import io
+import json
+import os
+
+import pytest
+
+import wrangler
+from wrangler import _iter_json_array, DataWrangler
+
+CHUNK_SIZES = [1, 2, 3, 7, 64, 1 << 20]
+
+
+def export_ticket(ticket_id):
+    """One ticket as the Zendesk tickets export writes it."""
+    return {
+        "id": ticket_id,
+        "created_at": "2024-03-01T09:30:00Z",
+        "updated_at": "2024-03-02T16:00:00Z",
+        "subject": f"Question {ticket_id} does not render",
+        "tags": ["rendering"],
+        "fields": [{"value": "problem"}, {"value": None}, {"value": "fixed"}],
+        "status": "solved",
+        "description": f"Item {ticket_id} shows a blank question after saving.",
+    }
+
+
+@pytest.fixture
+def inputs(tmp_path, monkeypatch):
+    """A ticket file and comments directory with three tickets, two with comments."""
+    monkeypatch.setattr(wrangler, "COMMENT_PARSE_PROCESSES", 1)
+    ticket_file = tmp_path / "tickets.json"
+    ticket_file.write_text(json.dumps([export_ticket(i) for i in (101, 102, 103)]))
+    comments_dir = tmp_path / "comments"
+    comments_dir.mkdir()
+    for ticket_id in (101, 103):
+        (comments_dir / f"{ticket_id}_comments.json").write_text(
+            json.dumps(
+                {
+                    "comments": [
+                        {
+                            "id": ticket_id * 10 + n,
+                            "created_at": "2024-03-01T10:00:00Z",
+                            "plain_body": f"Reply {n} about the rendering fix",
+                        }
+                        for n in range(2)
+                    ]
+                }
+            )
+        )
+    return ticket_file, comments_dir
+
+
+def iter_items(text, chunk_size):
+    return list(_iter_json_array(io.StringIO(text), chunk_size=chunk_size))
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_objects_split_across_chunks(chunk_size):
+    items = [
+        {"id": i, "subject": f"Ticket {i}", "score": -1500.25 * i, "tags": ["a", "b"]}
+        for i in range(20)
+    ]
+    assert iter_items(json.dumps(items), chunk_size) == items
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_escaped_quotes_and_brackets_in_strings(chunk_size):
+    items = [
+        {"body": 'He said "close ]this[" then left', "path": "C:\\tmp\\]"},
+        '"]", "[',
+        {"nested": [{"x": "}{,"}]},
+    ]
+    assert iter_items(json.dumps(items), chunk_size) == items
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_empty_array(chunk_size):
+    assert iter_items("[]", chunk_size) == []
+    assert iter_items(" [ \n ] ", chunk_size) == []
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_whitespace_and_trailing_newline(chunk_size):
+    items = [{"id": 1}, 2, "three", None, True]
+    text = json.dumps(items, indent=4) + "\n"
+    assert iter_items("\n\t " + text, chunk_size) == items
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize(
+    "text",
+    ["", "   ", '{"id": 1}', "[1, 2", '[{"id": 1}', "[1 2]", "[tru]", '["open]'],
+)
+def test_malformed_input_raises(text, chunk_size):
+    with pytest.raises(json.JSONDecodeError):
+        iter_items(text, chunk_size)
+
+
+def test_stages_run_once_per_input(inputs):
+    ticket_file, comments_dir = inputs
+    worker = DataWrangler.WranglerWorker(
+        DataWrangler(comments_dir=comments_dir, ticket_file=ticket_file)
+    )
+
+    # Comments cannot be bound to tickets that have not been reshaped yet.
+    assert not worker.comments_bound()
+
+    assert worker.tickets_reshaped()
+    tickets = worker.wrangler.wrangled_tickets
+    assert [ticket.id for ticket in tickets] == [101, 102, 103]
+    assert worker.tickets_reshaped()
+    assert worker.wrangler.wrangled_tickets is tickets
+
+    assert worker.comments_bound()
+    comment_counts = [len(ticket.comments) for ticket in tickets]
+    assert comment_counts == [3, 1, 3]
+    assert worker.comments_bound()
+    assert [len(ticket.comments) for ticket in tickets] == comment_counts
+
+    # New inputs start over from the first stage.
+    worker.wrangler.ticket_file = ticket_file
+    assert worker.wrangler.wrangled_tickets == []
+    assert worker.tickets_reshaped()
+    assert len(worker.wrangler.wrangled_tickets) == 3
+
+
+def test_cache_keyed_on_format_version_and_bounded(inputs, tmp_path, monkeypatch):
+    monkeypatch.setattr(wrangler, "WRANGLE_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(wrangler, "WRANGLE_CACHE_ENTRIES", 2)
+    ticket_file, comments_dir = inputs
+    data_wrangler = DataWrangler(comments_dir=comments_dir, ticket_file=ticket_file)
+    worker = DataWrangler.WranglerWorker(data_wrangler)
+    assert worker.tickets_reshaped() and worker.comments_bound()
+    worker.create_corpus()
+    fingerprint = data_wrangler.fingerprint()
+    data_wrangler.save_cache(fingerprint)
+
+    restored = DataWrangler(comments_dir=comments_dir, ticket_file=ticket_file)
+    assert restored.load_cached(fingerprint)
+    assert restored.corpus == data_wrangler.corpus
+
+    # Results pickled under another format version are never looked up.
+    monkeypatch.setattr(
+        wrangler, "WRANGLE_CACHE_VERSION", wrangler.WRANGLE_CACHE_VERSION + 1
+    )
+    assert restored.fingerprint() != fingerprint
+    assert not restored.load_cached(restored.fingerprint())
+
+    # Older than anything saved from here on, whatever the clock resolution.
+    os.utime(tmp_path / "cache" / f"{fingerprint}.corpus.pkl", (0, 0))
+    for newer in ("a", "b"):
+        data_wrangler.save_cache(newer)
+    assert sorted(path.name for path in (tmp_path / "cache").iterdir()) == [
+        "a.corpus.pkl",
+        "b.corpus.pkl",
+    ]
+
+
+@pytest.mark.parametrize("indent", [True, False])
+def test_generate_json_matches_stdlib_encoding(inputs, tmp_path, monkeypatch, indent):
+    monkeypatch.chdir(tmp_path)
+    ticket_file, comments_dir = inputs
+    data_wrangler = DataWrangler(comments_dir=comments_dir, ticket_file=ticket_file)
+    worker = DataWrangler.WranglerWorker(data_wrangler)
+    assert worker.tickets_reshaped() and worker.comments_bound()
+    worker.create_corpus()
+
+    if indent:
+        data_wrangler.generate_json(filename="tickets.json")
+    else:
+        data_wrangler.generate_json(filename="tickets.json", indent=False)
+
+    text = (tmp_path / "completed" / "tickets.json").read_text()
+    assert ("\n  " in text) == indent
+    # Statuses, dates and bound comments come out as MyEncoder writes them.
+    assert json.loads(text) == json.loads(
+        json.dumps(
+            [ticket.__dict__ for ticket in data_wrangler.wrangled_tickets],
+            cls=wrangler.MyEncoder,
+        )
+    )
+    (corpus_file,) = (tmp_path / "completed").glob("corpus_*.json")
+    assert json.loads(corpus_file.read_text()) == data_wrangler.corpus